@@ -1,24 +1,41 @@
 import argparse
-import json
+import concurrent.futures
+import dataclasses
 import logging
+import logging.handlers
+import multiprocessing
 import pathlib
+import sys
 from collections import OrderedDict
-from datetime import datetime
-from typing import Any, Dict
-
-from mtgsqlive.converters import (
-    CsvConverter,
-    MysqlConverter,
-    ParquetConverter,
-    PostgresqlConverter,
-    SqliteConverter,
+from datetime import date, datetime
+from typing import Any, Callable, Dict, List, Optional, Tuple, Type, TypeVar
+
+from mtgsqlive import converters
+from mtgsqlive.converters.parents import (
+    AbstractConverter,
+    ConverterOptions,
+    SqlLikeConverter,
+)
+from mtgsqlive.enums.data_type import STREAMED_DATA_TYPES, MtgjsonDataType
+from mtgsqlive.utils import (
+    JSON_BACKENDS,
+    BuildCheckpoint,
+    get_file_sha256,
+    get_shard_dir_name,
+    load_index_plan,
+    load_json_file,
+    load_shard_groups,
+    load_streamed_mtgjson_file,
+    resolve_json_backend,
+    verify_manifests,
 )
-from mtgsqlive.enums.data_type import MtgjsonDataType
 
 TOP_LEVEL_DIR: pathlib.Path = pathlib.Path(__file__).resolve().parent.parent
 LOG_DIR: pathlib.Path = TOP_LEVEL_DIR.joinpath("logs")
 LOGGER = logging.getLogger(__name__)
 
+T = TypeVar("T")
+
 
 def init_logger() -> None:
     LOG_DIR.mkdir(exist_ok=True)
@@ -40,18 +57,26 @@ def init_logger() -> None:
     )
 
 
-def get_converters() -> Dict[str, Any]:
+def get_converters() -> Dict[str, str]:
+    # Maps each CLI flag to its converter's class name. Classes are resolved via
+    # load_converter() so only the selected converters' dependencies get imported
     return OrderedDict(
         {
-            "mysql": MysqlConverter,
-            "postgresql": PostgresqlConverter,
-            "sqlite": SqliteConverter,
-            "csv": CsvConverter,
-            "parquet": ParquetConverter,
+            "mysql": "MysqlConverter",
+            "mysql_bulk": "MysqlBulkConverter",
+            "postgresql": "PostgresqlConverter",
+            "sqlite": "SqliteConverter",
+            "csv": "CsvConverter",
+            "parquet": "ParquetConverter",
         }
     )
 
 
+def load_converter(converter_name: str) -> Type[AbstractConverter]:
+    converter: Type[AbstractConverter] = getattr(converters, converter_name)
+    return converter
+
+
 def parse_args() -> argparse.Namespace:
     parser = argparse.ArgumentParser()
 
@@ -60,7 +85,7 @@ def parse_args() -> argparse.Namespace:
         "--input-dir",
         type=str,
         required=True,
-        help="Path to directory that has MTGJSON compiled files, like AllPrintings.json and AllPricesToday.json",
+        help="Path to directory that has MTGJSON compiled files, like AllPrintings.json, AllPricesToday.json and AllPrices.json",
     )
     parser.add_argument(
         "-o",
@@ -77,6 +102,135 @@ def parse_args() -> argparse.Namespace:
         help="Transpose specific sets instead of all sets",
     )
 
+    output_group = parser.add_argument_group(title="Output Options")
+    output_group.add_argument(
+        "--tables",
+        type=str,
+        nargs="*",
+        help="Only build these tables & the tables they reference (e.g. cards sets cardPrices)",
+    )
+    output_group.add_argument(
+        "--exclude-tables",
+        type=str,
+        nargs="*",
+        default=[],
+        help="Skip building these tables (e.g. cardPurchaseUrls setTranslations)",
+    )
+    output_group.add_argument(
+        "--deduplicate-rulings",
+        action="store_true",
+        help="Store each distinct ruling once in a rulings table, linked to cards via cardRulings",
+    )
+    output_group.add_argument(
+        "--deduplicate-foreign-text",
+        action="store_true",
+        help="Store each distinct foreign text & flavor text once in a foreignTexts table",
+    )
+    output_group.add_argument(
+        "--booster-sampling",
+        action="store_true",
+        help="Also build cumulative booster & sheet weight range tables for pack simulation",
+    )
+
+    parser.add_argument(
+        "-j",
+        "--jobs",
+        type=int,
+        default=1,
+        help="Convert AllPrintings, AllPricesToday & AllPrices in up to this many parallel processes",
+    )
+    parser.add_argument(
+        "--json-backend",
+        choices=JSON_BACKENDS,
+        default="auto",
+        help="JSON decoder for the input files; auto picks orjson or ujson when installed",
+    )
+    parser.add_argument(
+        "--escape-cache-size",
+        type=int,
+        default=65_536,
+        help="Distinct short string literals to memoize while escaping, 0 to disable",
+    )
+    parser.add_argument(
+        "--writer-queue-depth",
+        type=int,
+        default=2,
+        help="Statement batches buffered for the background writer thread, 0 to write inline",
+    )
+    parser.add_argument(
+        "--manifests",
+        action="store_true",
+        help="Record per-table row counts & checksums of each output in OUTPUT_DIR/manifests",
+    )
+    parser.add_argument(
+        "--verify",
+        action="store_true",
+        help="Record manifests & compare the row counts & checksums of each output format",
+    )
+    parser.add_argument(
+        "--verify-against",
+        type=str,
+        help="Also compare them with the manifests of the previous build in this directory",
+    )
+    parser.add_argument(
+        "--resume",
+        action="store_true",
+        help="Continue an interrupted build, skipping converters & tables it already finished",
+    )
+
+    prices_group = parser.add_argument_group(title="Prices")
+    prices_group.add_argument(
+        "--price-start-date",
+        type=date.fromisoformat,
+        help="Oldest price date to keep, as YYYY-MM-DD (AllPricesToday defaults to 14 days ago)",
+    )
+    prices_group.add_argument(
+        "--price-end-date",
+        type=date.fromisoformat,
+        help="Newest price date to keep, as YYYY-MM-DD",
+    )
+
+    prices_group.add_argument(
+        "--price-summaries",
+        action="store_true",
+        help="Also build cardPricesLatest & cardPricesSummary (7/14 day min, max, avg) tables",
+    )
+
+    schema_group = parser.add_argument_group(title="Schema")
+    schema_group.add_argument(
+        "--schema-cache-dir",
+        type=str,
+        help="Cache inferred schemas here and reuse them for identical inputs",
+    )
+    schema_group.add_argument(
+        "--schema-file",
+        type=str,
+        help="Use this pinned schema (or schema cache file) for its data type instead of inferring one; it must match the table options",
+    )
+    schema_group.add_argument(
+        "--index-plan",
+        type=str,
+        help="JSON file mapping tables to the column lists to index, replacing those tables' default indexes",
+    )
+
+    shards_group = parser.add_argument_group(title="Shards")
+    shard_mode_group = shards_group.add_mutually_exclusive_group()
+    shard_mode_group.add_argument(
+        "--shard-by-set",
+        action="store_true",
+        help="Also write a separate AllPrintings database per set to OUTPUT_DIR/shards/{set}, with a _ after names Windows reserves (e.g. CON_)",
+    )
+    shard_mode_group.add_argument(
+        "--shard-groups",
+        type=str,
+        help="Also write a separate AllPrintings database per group of sets, from a JSON file mapping shard names to set codes",
+    )
+    shards_group.add_argument(
+        "--shard-parquet",
+        action="store_true",
+        help="Write Parquet files for each shard, next to its SQLite database",
+    )
+
     converter_group = parser.add_argument_group(title="Converters")
     converter_group.add_argument(
         "--all", action="store_true", help="Run all ETL operations"
@@ -87,6 +241,11 @@ def parse_args() -> argparse.Namespace:
     converter_group.add_argument(
         "--mysql", action="store_true", help="Compile AllPrintings.sql"
     )
+    converter_group.add_argument(
+        "--mysql-bulk",
+        action="store_true",
+        help="Compile MySQL schema, LOAD DATA files & loader script",
+    )
     converter_group.add_argument(
         "--parquet", action="store_true", help="Compile Parquet AllPrinting files"
     )
@@ -97,7 +256,448 @@ def parse_args() -> argparse.Namespace:
         "--sqlite", action="store_true", help="Compile AllPrintings.sqlite"
     )
 
-    return parser.parse_args()
+    args = parser.parse_args()
+    validate_table_selection(parser, args)
+    return args
+
+
+def validate_table_selection(
+    parser: argparse.ArgumentParser, args: argparse.Namespace
+) -> None:
+    known_table_names = SqlLikeConverter.get_known_table_names()
+    for option_name, table_names in (
+        ("--tables", args.tables or []),
+        ("--exclude-tables", args.exclude_tables),
+    ):
+        unknown_table_names = sorted(set(table_names) - known_table_names)
+        if unknown_table_names:
+            parser.error(
+                f"{option_name}: unknown table(s) {', '.join(unknown_table_names)} "
+                f"(choose from {', '.join(sorted(known_table_names))})"
+            )
+
+    table_dependencies = SqlLikeConverter.get_table_dependencies(
+        ConverterOptions(
+            deduplicate_rulings=args.deduplicate_rulings,
+            deduplicate_foreign_text=args.deduplicate_foreign_text,
+            price_summaries=args.price_summaries,
+        )
+    )
+    for table_name, dependency_names in table_dependencies.items():
+        if args.tables is not None and table_name in args.tables:
+            for dependency_name in sorted(dependency_names - set(args.tables)):
+                LOGGER.info(f"Also building {dependency_name}, {table_name} needs it")
+                args.tables.append(dependency_name)
+
+        table_selected = (
+            args.tables is None or table_name in args.tables
+        ) and table_name not in args.exclude_tables
+        excluded_dependency_names = sorted(dependency_names & set(args.exclude_tables))
+        if table_selected and excluded_dependency_names:
+            parser.error(
+                f"--exclude-tables: {table_name} needs "
+                f"{', '.join(excluded_dependency_names)}"
+            )
+
+
+def get_converter_options(args: argparse.Namespace) -> ConverterOptions:
+    converter_options = ConverterOptions(
+        deduplicate_rulings=args.deduplicate_rulings,
+        deduplicate_foreign_text=args.deduplicate_foreign_text,
+        booster_sampling=args.booster_sampling,
+        tables=set(args.tables) if args.tables is not None else None,
+        exclude_tables=set(args.exclude_tables),
+        schema_cache_dir=pathlib.Path(args.schema_cache_dir)
+        if args.schema_cache_dir
+        else None,
+        schema_file=pathlib.Path(args.schema_file) if args.schema_file else None,
+        price_start_date=args.price_start_date,
+        price_end_date=args.price_end_date,
+        price_summaries=args.price_summaries,
+        writer_queue_depth=args.writer_queue_depth,
+        escape_cache_size=args.escape_cache_size,
+        manifests=args.manifests or args.verify or bool(args.verify_against),
+    )
+    if args.index_plan:
+        converter_options = dataclasses.replace(
+            converter_options,
+            index_plan=load_index_plan(pathlib.Path(args.index_plan)),
+        )
+    return converter_options
+
+
+def init_worker_logger(log_queue: "multiprocessing.Queue[logging.LogRecord]") -> None:
+    # Worker processes forward their records to the parent's handlers
+    root_logger = logging.getLogger()
+    root_logger.handlers.clear()
+    root_logger.addHandler(logging.handlers.QueueHandler(log_queue))
+    root_logger.setLevel(logging.INFO)
+
+
+def get_build_checkpoint(
+    data_type: MtgjsonDataType,
+    args: argparse.Namespace,
+    converter_options: ConverterOptions,
+    mtgjson_input_file: pathlib.Path,
+) -> BuildCheckpoint:
+    # Progress only carries over while the input file and options are unchanged
+    input_stat = mtgjson_input_file.stat()
+    identity = {
+        "dataType": data_type.value,
+        "inputFile": {"size": input_stat.st_size, "mtimeNs": input_stat.st_mtime_ns},
+        "sets": sorted(args.sets) if args.sets else None,
+        "priceDateRange": converter_options.get_price_date_range(data_type),
+        "options": {
+            field.name: getattr(converter_options, field.name)
+            for field in dataclasses.fields(converter_options)
+            if field.metadata.get("affects_output", True)
+        },
+    }
+
+    checkpoint_path = (
+        pathlib.Path(args.output_dir)
+        .expanduser()
+        .joinpath(f"{data_type.value}.checkpoint.json")
+    )
+    if args.resume:
+        return BuildCheckpoint.load(checkpoint_path, identity)
+    return BuildCheckpoint(checkpoint_path, identity)
+
+
+def get_shard_converter_names(args: argparse.Namespace) -> List[str]:
+    # Parquet files are read back out of the shard's SQLite database
+    if args.shard_parquet:
+        return ["SqliteConverter", "ParquetConverter"]
+    return ["SqliteConverter"]
+
+
+def get_shard_data(
+    mtgjson_input_data: Dict[str, Any], shard_groups: Dict[str, List[str]]
+) -> Dict[str, Dict[str, Any]]:
+    # Shards only reference the parsed sets, nothing is copied until a shard
+    # is handed to a worker process
+    shards_data = {}
+    for shard_name, set_codes in shard_groups.items():
+        missing_set_codes = set(set_codes).difference(mtgjson_input_data["data"])
+        if missing_set_codes:
+            LOGGER.warning(
+                f"Shard {shard_name} has no sets {', '.join(sorted(missing_set_codes))}"
+            )
+
+        shard_sets = {
+            set_code: mtgjson_input_data["data"][set_code]
+            for set_code in set_codes
+            if set_code in mtgjson_input_data["data"]
+        }
+        if not shard_sets:
+            LOGGER.warning(f"Skipping shard {shard_name}, none of its sets were loaded")
+            continue
+
+        shards_data[shard_name] = {
+            "meta": mtgjson_input_data["meta"],
+            "data": shard_sets,
+        }
+    return shards_data
+
+
+def convert_shard(
+    shard_name: str,
+    shard_data: Dict[str, Any],
+    args: argparse.Namespace,
+    converter_options: ConverterOptions,
+) -> bool:
+    shard_dir = (
+        pathlib.Path(args.output_dir)
+        .expanduser()
+        .joinpath("shards", get_shard_dir_name(shard_name))
+    )
+    shard_dir.mkdir(parents=True, exist_ok=True)
+
+    # Shards are cheap to rebuild, so they skip checkpoints & the schema cache
+    shard_options = dataclasses.replace(
+        converter_options,
+        shard_name=shard_name,
+        checkpoint=None,
+        schema_cache_dir=None,
+    )
+    try:
+        for converter_name in get_shard_converter_names(args):
+            converter = load_converter(converter_name)(
+                shard_data,
+                str(shard_dir),
+                MtgjsonDataType.MTGJSON_CARDS,
+                shard_options,
+            )
+            converter.convert()
+            converter.write_manifest()
+    except Exception:
+        LOGGER.exception(f"Failed to build shard {shard_name}")
+        return False
+
+    LOGGER.info(f"Built shard {shard_name} in {shard_dir}")
+    return True
+
+
+def convert_shards(
+    mtgjson_input_data: Dict[str, Any],
+    args: argparse.Namespace,
+    converter_options: ConverterOptions,
+    shard_groups: Optional[Dict[str, List[str]]],
+) -> bool:
+    if shard_groups is None:
+        shard_groups = {
+            set_code: [set_code] for set_code in mtgjson_input_data["data"].keys()
+        }
+
+    shards_data = get_shard_data(mtgjson_input_data, shard_groups)
+    LOGGER.info(f"Building {len(shards_data)} shards")
+    shard_tasks = {
+        shard_name: (shard_name, shard_data, args, converter_options)
+        for shard_name, shard_data in shards_data.items()
+    }
+    if args.jobs > 1:
+        results = run_in_worker_processes(convert_shard, shard_tasks, args.jobs)
+    else:
+        results = {
+            shard_name: convert_shard(*shard_task)
+            for shard_name, shard_task in shard_tasks.items()
+        }
+
+    failed_shards = [
+        shard_name for shard_name, success in results.items() if not success
+    ]
+    if failed_shards:
+        LOGGER.error(f"Failed to build shards: {', '.join(failed_shards)}")
+        return False
+    return True
+
+
+def convert_data_type(
+    data_type: MtgjsonDataType,
+    args: argparse.Namespace,
+    converter_names: List[str],
+    converter_options: ConverterOptions,
+    shard_groups: Optional[Dict[str, List[str]]] = None,
+) -> bool:
+    mtgjson_input_file = (
+        pathlib.Path(args.input_dir).expanduser().joinpath(f"{data_type.value}.json")
+    )
+    if not mtgjson_input_file.exists():
+        LOGGER.error(f"Cannot locate {mtgjson_input_file}, skipping.")
+        return True
+
+    checkpoint = get_build_checkpoint(
+        data_type, args, converter_options, mtgjson_input_file
+    )
+    pending_converter_names = []
+    for converter_name in converter_names:
+        if checkpoint.is_converter_complete(converter_name):
+            LOGGER.info(
+                f"Skipping {data_type.value} via {converter_name}, already done"
+            )
+        else:
+            pending_converter_names.append(converter_name)
+
+    # Shards are split from AllPrintings, once it has been parsed
+    build_shards = data_type == MtgjsonDataType.MTGJSON_CARDS and (
+        args.shard_by_set or shard_groups is not None
+    )
+
+    # Nothing left to do, so don't bother parsing the input
+    if not pending_converter_names and not build_shards:
+        checkpoint.delete()
+        return True
+
+    converter_options = dataclasses.replace(converter_options, checkpoint=checkpoint)
+
+    try:
+        if data_type in STREAMED_DATA_TYPES:
+            mtgjson_input_data = load_streamed_mtgjson_file(mtgjson_input_file)
+        else:
+            mtgjson_input_data = load_json_file(mtgjson_input_file, args.json_backend)
+
+        if converter_options.schema_cache_dir:
+            converter_options = dataclasses.replace(
+                converter_options, input_hash=get_file_sha256(mtgjson_input_file)
+            )
+
+        if args.sets and data_type not in STREAMED_DATA_TYPES:
+            for set_key in list(mtgjson_input_data["data"].keys()):
+                if set_key not in args.sets:
+                    del mtgjson_input_data["data"][set_key]
+
+        for converter_name in pending_converter_names:
+            converter = load_converter(converter_name)
+            LOGGER.info(f"Converting {data_type.value} via {converter.__name__}")
+            data_type_converter = converter(
+                mtgjson_input_data, args.output_dir, data_type, converter_options
+            )
+            data_type_converter.convert()
+            data_type_converter.write_manifest()
+            checkpoint.mark_converter_complete(converter_name)
+            LOGGER.info(f"Converted {data_type.value} via {converter.__name__}")
+
+        if build_shards and not convert_shards(
+            mtgjson_input_data, args, converter_options, shard_groups
+        ):
+            return False
+    except Exception:
+        LOGGER.exception(f"Failed to convert {data_type.value}")
+        LOGGER.error(
+            f"Re-run with --resume to continue from {checkpoint.checkpoint_path}"
+        )
+        return False
+
+    # The checkpoint is only needed to recover from failures
+    checkpoint.delete()
+    return True
+
+
+def run_in_worker_process(
+    task: Callable[..., bool],
+    args: Tuple[Any, ...],
+    log_queue: "multiprocessing.Queue[logging.LogRecord]",
+) -> bool:
+    # A pool of its own, so the task only fails if it kills its own worker
+    with concurrent.futures.ProcessPoolExecutor(
+        max_workers=1,
+        initializer=init_worker_logger,
+        initargs=(log_queue,),
+    ) as executor:
+        return executor.submit(task, *args).result()
+
+
+def run_in_worker_processes(
+    task: Callable[..., bool],
+    task_args: Dict[T, Tuple[Any, ...]],
+    max_workers: int,
+) -> Dict[T, bool]:
+    log_queue: "multiprocessing.Queue[logging.LogRecord]" = multiprocessing.Queue()
+    log_listener = logging.handlers.QueueListener(
+        log_queue, *logging.getLogger().handlers, respect_handler_level=True
+    )
+    log_listener.start()
+
+    try:
+        results = {}
+        broken_task_keys = []
+        with concurrent.futures.ProcessPoolExecutor(
+            max_workers=max_workers,
+            initializer=init_worker_logger,
+            initargs=(log_queue,),
+        ) as executor:
+            futures = {
+                task_key: executor.submit(task, *args)
+                for task_key, args in task_args.items()
+            }
+
+            for task_key, future in futures.items():
+                try:
+                    results[task_key] = future.result()
+                except concurrent.futures.process.BrokenProcessPool:
+                    # One dead worker (e.g. OOM killed) breaks the whole pool,
+                    # failing every unfinished task along with its own
+                    broken_task_keys.append(task_key)
+                except Exception:
+                    LOGGER.exception(f"Worker for {task_key} failed")
+                    results[task_key] = False
+
+        if broken_task_keys:
+            LOGGER.warning(
+                "A worker process died, re-running "
+                f"{', '.join(map(str, broken_task_keys))} in a process each"
+            )
+            with concurrent.futures.ThreadPoolExecutor(
+                max_workers=max_workers
+            ) as isolated_executor:
+                isolated_futures = {
+                    task_key: isolated_executor.submit(
+                        run_in_worker_process, task, task_args[task_key], log_queue
+                    )
+                    for task_key in broken_task_keys
+                }
+
+                for task_key, future in isolated_futures.items():
+                    try:
+                        results[task_key] = future.result()
+                    except Exception:
+                        LOGGER.exception(f"Worker for {task_key} crashed")
+                        results[task_key] = False
+    finally:
+        log_listener.stop()
+
+    return results
+
+
+def convert_data_types_concurrently(
+    args: argparse.Namespace,
+    converter_names: List[str],
+    converter_options: ConverterOptions,
+    shard_groups: Optional[Dict[str, List[str]]],
+) -> Dict[MtgjsonDataType, bool]:
+    results = run_in_worker_processes(
+        convert_data_type,
+        {
+            data_type.value: (
+                data_type,
+                args,
+                converter_names,
+                converter_options,
+                shard_groups,
+            )
+            for data_type in MtgjsonDataType
+        },
+        args.jobs,
+    )
+    return {data_type: results[data_type.value] for data_type in MtgjsonDataType}
+
+
+def verify_build(args: argparse.Namespace) -> bool:
+    # Checks the top level outputs & every shard, each against its own files
+    # in the previous build
+    output_dir = pathlib.Path(args.output_dir).expanduser()
+    previous_output_dir = (
+        pathlib.Path(args.verify_against).expanduser() if args.verify_against else None
+    )
+    if previous_output_dir is not None and not previous_output_dir.is_dir():
+        LOGGER.error(f"Cannot locate previous build {previous_output_dir}")
+        return False
+
+    manifest_count = 0
+    mismatches: List[str] = []
+    for manifest_dir in [
+        output_dir.joinpath("manifests"),
+        *sorted(output_dir.glob("shards/*/manifests")),
+    ]:
+        if not manifest_dir.is_dir():
+            continue
+
+        relative_manifest_dir = manifest_dir.relative_to(output_dir)
+        dir_manifest_count, dir_mismatches = verify_manifests(
+            manifest_dir,
+            previous_output_dir.joinpath(relative_manifest_dir)
+            if previous_output_dir is not None
+            else None,
+        )
+        manifest_count += dir_manifest_count
+        mismatches.extend(
+            f"{relative_manifest_dir.parent}: {mismatch}"
+            if relative_manifest_dir.parent.name
+            else mismatch
+            for mismatch in dir_mismatches
+        )
+
+    if not manifest_count:
+        LOGGER.error(f"No manifests to verify in {output_dir}")
+        return False
+
+    for mismatch in mismatches:
+        LOGGER.error(f"Verification failed: {mismatch}")
+    if mismatches:
+        return False
+
+    LOGGER.info(f"Verified {manifest_count} manifests in {output_dir}")
+    return True
 
 
 def main() -> None:
@@ -110,26 +710,48 @@ def main() -> None:
         for converter_input_param in converters_map.copy().keys():
             if not getattr(args, converter_input_param):
                 del converters_map[converter_input_param]
+    converter_names = list(converters_map.values())
+    try:
+        converter_options = get_converter_options(args)
+    except (OSError, ValueError) as error:
+        LOGGER.error(f"Invalid index plan: {error}")
+        sys.exit(1)
+    try:
+        shard_groups = (
+            load_shard_groups(pathlib.Path(args.shard_groups))
+            if args.shard_groups
+            else None
+        )
+    except (OSError, ValueError) as error:
+        LOGGER.error(f"Invalid shard groups: {error}")
+        sys.exit(1)
+    try:
+        LOGGER.info(f"Decoding JSON with {resolve_json_backend(args.json_backend)}")
+    except ImportError:
+        LOGGER.error(f"JSON backend {args.json_backend} is not installed")
+        sys.exit(1)
 
-    mtgjson_input_dir = pathlib.Path(args.input_dir).expanduser()
-    for data_type in MtgjsonDataType:
-        mtgjson_input_file = mtgjson_input_dir.joinpath(f"{data_type.value}.json")
-        if not mtgjson_input_file.exists():
-            LOGGER.error(f"Cannot locate {mtgjson_input_file}, skipping.")
-            continue
-
-        with mtgjson_input_file.open(encoding="utf-8") as fp:
-            mtgjson_input_data = json.load(fp)
+    if args.jobs > 1:
+        results = convert_data_types_concurrently(
+            args, converter_names, converter_options, shard_groups
+        )
+    else:
+        results = {
+            data_type: convert_data_type(
+                data_type, args, converter_names, converter_options, shard_groups
+            )
+            for data_type in MtgjsonDataType
+        }
 
-        if args.sets:
-            for set_key in list(mtgjson_input_data["data"].keys()):
-                if set_key not in args.sets:
-                    del mtgjson_input_data["data"][set_key]
+    failed_data_types = [
+        data_type.value for data_type, success in results.items() if not success
+    ]
+    if failed_data_types:
+        LOGGER.error(f"Failed to convert: {', '.join(failed_data_types)}")
+        sys.exit(1)
 
-        for converter in converters_map.values():
-            LOGGER.info(f"Converting {data_type.value} via {converter.__name__}")
-            converter(mtgjson_input_data, args.output_dir, data_type).convert()
-            LOGGER.info(f"Converted {data_type.value} via {converter.__name__}")
+    if (args.verify or args.verify_against) and not verify_build(args):
+        sys.exit(1)
 
 
 if __name__ == "__main__":
@@ -1,5 +1,22 @@
-from .csv import CsvConverter
-from .mysql import MysqlConverter
-from .parquet import ParquetConverter
-from .postgresql import PostgresqlConverter
-from .sqlite import SqliteConverter
+import importlib
+from typing import Any, Dict, List
+
+_CONVERTER_MODULES: Dict[str, str] = {
+    "CsvConverter": ".csv",
+    "MysqlConverter": ".mysql",
+    "MysqlBulkConverter": ".mysql_bulk",
+    "ParquetConverter": ".parquet",
+    "PostgresqlConverter": ".postgresql",
+    "SqliteConverter": ".sqlite",
+}
+
+__all__: List[str] = list(_CONVERTER_MODULES)
+
+
+def __getattr__(name: str) -> Any:
+    # Converters pull in heavy dependencies (pandas, pyarrow, SQLAlchemy, PyMySQL),
+    # so each one is only imported the first time it is requested
+    if name in _CONVERTER_MODULES:
+        module = importlib.import_module(_CONVERTER_MODULES[name], __name__)
+        return getattr(module, name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -1,18 +1,34 @@
-from typing import Any, Dict
+import logging
+from typing import Any, Dict, Optional
 
 from ..enums import MtgjsonDataType
-from .parents import SqliteBasedConverter
+from .parents import ConverterOptions, SqliteBasedConverter
+
+LOGGER = logging.getLogger(__name__)
 
 
 class CsvConverter(SqliteBasedConverter):
     def __init__(
-        self, mtgjson_data: Dict[str, Any], output_dir: str, data_type: MtgjsonDataType
+        self,
+        mtgjson_data: Dict[str, Any],
+        output_dir: str,
+        data_type: MtgjsonDataType,
+        options: Optional[ConverterOptions] = None,
     ) -> None:
-        super().__init__(mtgjson_data, output_dir, data_type)
+        super().__init__(mtgjson_data, output_dir, data_type, options)
         self.output_obj.root_dir.joinpath("csv").mkdir(parents=True, exist_ok=True)
 
     def convert(self) -> None:
         for table_name in self.get_table_names():
+            if self.is_checkpoint_step_complete(table_name):
+                LOGGER.info(f"Skipping {table_name}, finished in a previous run")
+                continue
+
+            if self.is_partitioned_table(table_name):
+                self.__write_table_in_chunks(table_name)
+                self.mark_checkpoint_step_complete(table_name)
+                continue
+
             pd_table = self.get_table_dataframe(table_name)
 
             pd_table.to_csv(
@@ -24,3 +40,20 @@ class CsvConverter(SqliteBasedConverter):
                 encoding="utf-8",
                 index=False,
             )
+            self.mark_checkpoint_step_complete(table_name)
+
+        # Done reading, let SQLite tidy up its -wal & -shm files
+        self.sqlite_engine.dispose()
+
+    def __write_table_in_chunks(self, table_name: str) -> None:
+        csv_path = self.output_obj.root_dir.joinpath("csv").joinpath(
+            f"{self.data_type.value}_{table_name}.csv"
+        )
+        for index, pd_chunk in enumerate(self.get_table_dataframe_chunks(table_name)):
+            pd_chunk.to_csv(
+                str(csv_path),
+                encoding="utf-8",
+                index=False,
+                mode="w" if index == 0 else "a",
+                header=index == 0,
+            )
@@ -1,20 +1,43 @@
+import json
+import re
 from datetime import datetime
-from typing import Any, Dict, Iterator
+from typing import Any, Dict, Iterator, List, Optional
 
 import pymysql.converters
 
-from .parents import SqlLikeConverter
-from .parents.sql_like import MtgjsonDataType
+from .parents import ConverterOptions, Row, SqlLikeConverter
+from .parents.sql_like import STREAMED_DATA_TYPES, MtgjsonDataType
+
+# NULL, a boolean's 1 or 0, or a double quoted, backslash escaped literal
+MYSQL_VALUE_PATTERN = re.compile(r'(NULL)|([01])|"([^"\\]*(?:\\.[^"\\]*)*)"', re.DOTALL)
+MYSQL_ESCAPE_PATTERN = re.compile(r"\\(.)", re.DOTALL)
+# Escapes pymysql writes that don't stand for the escaped character itself
+MYSQL_UNESCAPES = {"0": "\0", "n": "\n", "r": "\r", "Z": "\x1a"}
+
+
+def unescape_mysql_string(value: str) -> str:
+    if "\\" not in value:
+        return value
+    return MYSQL_ESCAPE_PATTERN.sub(
+        lambda escape: MYSQL_UNESCAPES.get(escape[1], escape[1]), value
+    )
 
 
 class MysqlConverter(SqlLikeConverter):
+    # Keeps utf8mb4 index keys within InnoDB's 767 byte limit
+    text_index_prefix_length = 191
+
     def __init__(
-        self, mtgjson_data: Dict[str, Any], output_dir: str, data_type: MtgjsonDataType
+        self,
+        mtgjson_data: Dict[str, Any],
+        output_dir: str,
+        data_type: MtgjsonDataType,
+        options: Optional[ConverterOptions] = None,
     ):
-        super().__init__(mtgjson_data, output_dir, data_type)
-        self.output_obj.fp = self.output_obj.root_dir.joinpath(
-            f"{data_type.value}.sql"
-        ).open("w", encoding="utf-8")
+        super().__init__(mtgjson_data, output_dir, data_type, options)
+        self.output_obj.fp = self.open_resumable_output_file(
+            self.output_obj.root_dir.joinpath(f"{data_type.value}.sql")
+        )
 
     def convert(self) -> None:
         sql_schema_as_dict = self._generate_sql_schema_dict()
@@ -40,39 +63,64 @@ class MysqlConverter(SqlLikeConverter):
                 "",
             )
         )
-        self.output_obj.fp.write(header)
+        if not self.is_checkpoint_step_complete("schema"):
+            self.output_obj.fp.write(header)
+            self.mark_checkpoint_step_complete(
+                "schema", offset=self.get_output_offset()
+            )
+
+        if (
+            self.data_type in STREAMED_DATA_TYPES
+            and not self.is_checkpoint_step_complete("partitions")
+        ):
+            self.write_partitioned_statements_to_files(
+                self.generate_partitioned_insert_statements(sql_schema_as_dict),
+                file_extension="sql",
+                session_statements=("SET names 'utf8mb4';",),
+            )
+            self.mark_checkpoint_step_complete("partitions")
 
-        insert_data_generator = self.generate_database_insert_statements()
-        self.write_statements_to_file(insert_data_generator)
+        self.write_tables_to_file(
+            sql_schema_as_dict,
+            skip_partitioned_tables=self.data_type in STREAMED_DATA_TYPES,
+        )
         self.output_obj.fp.write("\nCOMMIT;")
 
-    def create_insert_statement_body(self, data: Dict[str, Any]) -> str:
+    def create_insert_statement_body(self, data: Row) -> str:
         pre_processed_values = []
-        for value in data.values():
+        for value in data:
             if value is None:
                 pre_processed_values.append("NULL")
-                continue
-
-            if isinstance(value, list):
-                pre_processed_values.append(
-                    '"'
-                    + pymysql.converters.escape_string(", ".join(map(str, value)))
-                    + '"'
-                )
             elif isinstance(value, bool):
                 pre_processed_values.append("1" if value else "0")
-            else:
+            elif isinstance(value, (int, float)):
+                # Numbers never contain characters that need escaping
+                pre_processed_values.append(f'"{value}"')
+            elif isinstance(value, str):
+                pre_processed_values.append(self.format_string_literal(value))
+            elif isinstance(value, list):
                 pre_processed_values.append(
-                    '"' + pymysql.converters.escape_string(str(value)) + '"'
+                    self.format_string_literal(", ".join(map(str, value)))
                 )
+            elif isinstance(value, dict):
+                pre_processed_values.append(
+                    self.format_string_literal(json.dumps(value))
+                )
+            else:
+                pre_processed_values.append(self.format_string_literal(str(value)))
 
         return ", ".join(pre_processed_values)
 
+    @staticmethod
+    def escape_string_literal(value: str) -> str:
+        return '"' + pymysql.converters.escape_string(value) + '"'
+
+    @staticmethod
+    def decode_insert_statement_body(body: str) -> List[Optional[str]]:
+        return [
+            None if null else boolean or unescape_mysql_string(value)
+            for null, boolean, value in MYSQL_VALUE_PATTERN.findall(body)
+        ]
+
     def write_statements_to_file(self, data_generator: Iterator[str]) -> None:
-        statements = []
-        for statement in data_generator:
-            statements.append(statement)
-            if len(statements) >= 1_000:
-                self.output_obj.fp.writelines(statements)
-                statements = []
-        self.output_obj.fp.writelines(statements)
+        self.write_statement_batches(data_generator, self.output_obj.fp.writelines)
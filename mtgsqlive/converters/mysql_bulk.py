@@ -0,0 +1,209 @@
+import json
+import pathlib
+import re
+from datetime import datetime
+from typing import Any, Dict, Iterator, List, Optional, Sequence, TextIO, Tuple
+
+from ..enums import MtgjsonDataType
+from .parents import ConverterOptions, Row, SqlLikeConverter
+
+# LOAD DATA's default ESCAPED BY '\\' rules for characters that would
+# otherwise end a field or line, or be read as an escape themselves
+LOAD_DATA_ESCAPES = str.maketrans(
+    {"\\": "\\\\", "\t": "\\t", "\n": "\\n", "\r": "\\r", "\0": "\\0"}
+)
+LOAD_DATA_ESCAPE_PATTERN = re.compile(r"\\(.)", re.DOTALL)
+LOAD_DATA_UNESCAPES = {"t": "\t", "n": "\n", "r": "\r", "0": "\0"}
+
+
+def unescape_load_data_value(value: str) -> str:
+    if "\\" not in value:
+        return value
+    return LOAD_DATA_ESCAPE_PATTERN.sub(
+        lambda escape: LOAD_DATA_UNESCAPES.get(escape[1], escape[1]), value
+    )
+
+
+# Writes schema.sql, one tab separated data file per table and a load.sql that
+# bulk loads them with LOAD DATA LOCAL INFILE. Run both scripts from inside the
+# output directory, e.g. `mysql --local-infile=1 db < schema.sql`
+class MysqlBulkConverter(SqlLikeConverter):
+    bulk_dir: pathlib.Path
+
+    # Data files hold raw values, so nothing gets quoted
+    string_quote = ""
+    # Keeps utf8mb4 index keys within InnoDB's 767 byte limit
+    text_index_prefix_length = 191
+
+    def __init__(
+        self,
+        mtgjson_data: Dict[str, Any],
+        output_dir: str,
+        data_type: MtgjsonDataType,
+        options: Optional[ConverterOptions] = None,
+    ) -> None:
+        super().__init__(mtgjson_data, output_dir, data_type, options)
+        self.bulk_dir = self.output_obj.root_dir.joinpath("mysql_bulk", data_type.value)
+        self.discard_stale_checkpoint(self.bulk_dir)
+        self.bulk_dir.mkdir(parents=True, exist_ok=True)
+
+    def convert(self) -> None:
+        sql_schema_as_dict = self._generate_sql_schema_dict()
+
+        if not self.is_checkpoint_step_complete("schema"):
+            # Secondary indexes are left to load.sql, after the data is in
+            schema_query = self._convert_schema_dict_to_query(
+                sql_schema_as_dict,
+                engine="ENGINE=InnoDB DEFAULT CHARSET=utf8mb4",
+                primary_key_op="INTEGER PRIMARY KEY AUTO_INCREMENT",
+                include_indexes=False,
+            )
+            with self.bulk_dir.joinpath("schema.sql").open("w", encoding="utf-8") as fp:
+                fp.write(self.__get_file_header())
+                fp.write(f"SET names 'utf8mb4';\n\n{schema_query}\n")
+            self.mark_checkpoint_step_complete("schema")
+
+        load_statements: List[str] = []
+        for table_name, columns, row_bodies in self.get_table_row_bodies(
+            sql_schema_as_dict
+        ):
+            table_step = self.get_checkpoint_step(table_name)
+            if table_step is None:
+                data_files = self.__write_table_data_files(
+                    table_name, columns, row_bodies
+                )
+                table_step = {"dataFiles": data_files}
+                if self.latest_price_date is not None:
+                    table_step["latestPriceDate"] = self.latest_price_date
+                self.mark_checkpoint_step_complete(table_name, **table_step)
+
+            self.latest_price_date = table_step.get(
+                "latestPriceDate", self.latest_price_date
+            )
+            load_statements.extend(
+                self.__get_load_data_statement(data_file, table_name, columns)
+                for data_file in table_step["dataFiles"]
+            )
+
+        self.__write_loader_script(sql_schema_as_dict, load_statements)
+        self.log_escape_cache_stats()
+
+    def create_insert_statement_body(self, data: Row) -> str:
+        # A data file line rather than a VALUES tuple
+        pre_processed_values = []
+        for value in data:
+            if value is None:
+                pre_processed_values.append("\\N")
+            elif isinstance(value, bool):
+                pre_processed_values.append("1" if value else "0")
+            elif isinstance(value, (int, float)):
+                pre_processed_values.append(str(value))
+            elif isinstance(value, str):
+                pre_processed_values.append(self.format_string_literal(value))
+            elif isinstance(value, list):
+                pre_processed_values.append(
+                    self.format_string_literal(", ".join(map(str, value)))
+                )
+            elif isinstance(value, dict):
+                pre_processed_values.append(
+                    self.format_string_literal(json.dumps(value))
+                )
+            else:
+                pre_processed_values.append(self.format_string_literal(str(value)))
+
+        return "\t".join(pre_processed_values)
+
+    @staticmethod
+    def escape_string_literal(value: str) -> str:
+        return value.translate(LOAD_DATA_ESCAPES)
+
+    @staticmethod
+    def decode_insert_statement_body(body: str) -> List[Optional[str]]:
+        return [
+            None if value == "\\N" else unescape_load_data_value(value)
+            for value in body.split("\t")
+        ]
+
+    def write_statements_to_file(self, data_generator: Iterator[str]) -> None:
+        self.write_statement_batches(data_generator, self.output_obj.fp.writelines)
+
+    def __write_table_data_files(
+        self,
+        table_name: str,
+        columns: Sequence[str],
+        row_bodies: Iterator[Tuple[Row, str]],
+    ) -> List[str]:
+        if not self.is_partitioned_table(table_name):
+            data_file = f"{table_name}.tsv"
+            with self.bulk_dir.joinpath(data_file).open(
+                "w", encoding="utf-8", newline="\n"
+            ) as fp:
+                self.output_obj.fp = fp
+                self.write_statements_to_file(f"{body}\n" for _, body in row_bodies)
+            return [data_file]
+
+        # Partitioned tables get one data file per month
+        partition_index = list(columns).index(self.partitioned_tables[table_name])
+        partition_fps: Dict[str, TextIO] = {}
+        try:
+            for row, body in row_bodies:
+                partition = str(row[partition_index])[:7]
+                if partition not in partition_fps:
+                    partition_fps[partition] = self.bulk_dir.joinpath(
+                        f"{table_name}_{partition}.tsv"
+                    ).open("w", encoding="utf-8", newline="\n")
+                partition_fps[partition].write(f"{body}\n")
+        finally:
+            for partition_fp in partition_fps.values():
+                partition_fp.close()
+
+        return [f"{table_name}_{partition}.tsv" for partition in sorted(partition_fps)]
+
+    def __write_loader_script(
+        self, schema: Dict[str, Any], load_statements: List[str]
+    ) -> None:
+        with self.bulk_dir.joinpath("load.sql").open("w", encoding="utf-8") as fp:
+            self.output_obj.fp = fp
+            fp.write(self.__get_file_header())
+            fp.write(
+                "SET names 'utf8mb4';\n"
+                "SET foreign_key_checks = 0;\n"
+                "SET unique_checks = 0;\n\n"
+            )
+            fp.writelines(load_statements)
+
+            fp.write("\n")
+            for table_name, table_data in schema.items():
+                for index_query in self._get_table_index_queries(
+                    table_name, table_data
+                ):
+                    fp.write(f"{index_query}\n")
+
+            fp.write("\n")
+            self.write_statements_to_file(
+                self.generate_derived_table_statements(schema)
+            )
+            fp.write("\nSET unique_checks = 1;\nSET foreign_key_checks = 1;\n")
+
+    @staticmethod
+    def __get_load_data_statement(
+        data_file: str, table_name: str, columns: Sequence[str]
+    ) -> str:
+        return (
+            f"LOAD DATA LOCAL INFILE '{data_file}' INTO TABLE {table_name}\n"
+            "CHARACTER SET utf8mb4\n"
+            "FIELDS TERMINATED BY '\\t' ESCAPED BY '\\\\'\n"
+            "LINES TERMINATED BY '\\n'\n"
+            f"({', '.join(columns)});\n"
+        )
+
+    def __get_file_header(self) -> str:
+        return "\n".join(
+            (
+                "-- MTGSQLive Output File",
+                f"-- {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}",
+                f"-- MTGJSON Version: {self.get_version()}",
+                "",
+                "",
+            )
+        )
@@ -1,3 +1,24 @@
-from .abstract import AbstractConverter
+from typing import TYPE_CHECKING, Any
+
+from .abstract import AbstractConverter, ConverterOptions, Row
 from .sql_like import SqlLikeConverter
-from .sqlite_based_converter import SqliteBasedConverter
+
+if TYPE_CHECKING:
+    from .sqlite_based_converter import SqliteBasedConverter
+
+__all__ = [
+    "AbstractConverter",
+    "ConverterOptions",
+    "Row",
+    "SqlLikeConverter",
+    "SqliteBasedConverter",
+]
+
+
+def __getattr__(name: str) -> Any:
+    # SqliteBasedConverter depends on pandas & SQLAlchemy, so defer it until needed
+    if name == "SqliteBasedConverter":
+        from .sqlite_based_converter import SqliteBasedConverter
+
+        return SqliteBasedConverter
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -1,10 +1,16 @@
 import abc
+import dataclasses
 import datetime
+import hashlib
 import pathlib
 from sqlite3 import Connection
-from typing import Any, Dict, Iterator, Optional, TextIO
+from typing import Any, Callable, Dict, Iterator, Optional, Sequence, Set, TextIO, Tuple
 
-from ...enums import MtgjsonDataType
+from ...enums import STREAMED_DATA_TYPES, MtgjsonDataType
+from ...utils import DEFAULT_INDEX_PLAN, BuildCheckpoint, BuildManifest, IndexPlan
+
+# A single table row, with values in the table's column order
+Row = Tuple[Any, ...]
 
 
 class OutputObject:
@@ -15,10 +21,78 @@ class OutputObject:
         self.root_dir = root_dir
 
 
+@dataclasses.dataclass
+class ConverterOptions:
+    deduplicate_rulings: bool = False
+    deduplicate_foreign_text: bool = False
+    price_summaries: bool = False
+    booster_sampling: bool = False
+    tables: Optional[Set[str]] = None
+    exclude_tables: Set[str] = dataclasses.field(default_factory=set)
+    # Set when building one shard of a sharded AllPrintings
+    shard_name: Optional[str] = None
+    schema_cache_dir: Optional[pathlib.Path] = dataclasses.field(
+        default=None, metadata={"affects_schema": False}
+    )
+    schema_file: Optional[pathlib.Path] = dataclasses.field(
+        default=None, metadata={"affects_schema": False}
+    )
+    input_hash: Optional[str] = dataclasses.field(
+        default=None, metadata={"affects_schema": False}
+    )
+    price_start_date: Optional[datetime.date] = dataclasses.field(
+        default=None, metadata={"affects_schema": False}
+    )
+    price_end_date: Optional[datetime.date] = dataclasses.field(
+        default=None, metadata={"affects_schema": False}
+    )
+    # Added to the schema after it is inferred or loaded, so never cached
+    index_plan: IndexPlan = dataclasses.field(
+        default_factory=lambda: dict(DEFAULT_INDEX_PLAN),
+        metadata={"affects_schema": False},
+    )
+    # Tables a resumed build skips only have manifests if the first run kept them
+    manifests: bool = dataclasses.field(
+        default=False, metadata={"affects_schema": False}
+    )
+    escape_cache_size: int = dataclasses.field(
+        default=65_536, metadata={"affects_schema": False, "affects_output": False}
+    )
+    writer_queue_depth: int = dataclasses.field(
+        default=2, metadata={"affects_schema": False, "affects_output": False}
+    )
+    checkpoint: Optional[BuildCheckpoint] = dataclasses.field(
+        default=None, metadata={"affects_schema": False, "affects_output": False}
+    )
+
+    def get_price_date_range(
+        self, data_type: MtgjsonDataType
+    ) -> Tuple[Optional[datetime.date], Optional[datetime.date]]:
+        # AllPricesToday keeps its historical two week window unless told otherwise
+        oldest_date = self.price_start_date
+        if oldest_date is None and data_type == MtgjsonDataType.MTGJSON_CARD_PRICES:
+            oldest_date = datetime.date.today() - datetime.timedelta(days=14)
+        return oldest_date, self.price_end_date
+
+    def is_table_selected(self, table_name: str) -> bool:
+        if self.tables is not None and table_name not in self.tables:
+            return False
+        return table_name not in self.exclude_tables
+
+    def get_schema_fingerprint(self) -> Dict[str, Any]:
+        return {
+            field.name: getattr(self, field.name)
+            for field in dataclasses.fields(self)
+            if field.metadata.get("affects_schema", True)
+        }
+
+
 class AbstractConverter(abc.ABC):
     mtgjson_data: Dict[str, Any]
     output_obj: OutputObject
     data_type: MtgjsonDataType
+    options: ConverterOptions
+    manifest: BuildManifest
 
     set_keys_to_skip = {
         "booster",  # Broken out into BoosterContents, BoosterContentWeights, BoosterSheets, BoosterSheetCards
@@ -37,105 +111,350 @@ class AbstractConverter(abc.ABC):
         "rulings",  # Broken out into cardRulings
     }
 
+    # Tables written in monthly partitions for STREAMED_DATA_TYPES, keyed by
+    # the date column they are partitioned on
+    partitioned_tables = {"cardPrices": "date"}
+
+    # Column order of the rows yielded by the fixed-shape generators
+    set_translation_columns = ("language", "setCode", "translation")
+    card_price_columns = (
+        "uuid",
+        "gameAvailability",
+        "priceProvider",
+        "providerListing",
+        "cardFinish",
+        "date",
+        "price",
+        "currency",
+    )
+    ruling_columns = ("rulingId", "date", "text")
+    card_ruling_link_columns = ("uuid", "rulingId")
+    foreign_text_columns = ("textId", "text")
+    booster_contents_columns = (
+        "setCode",
+        "boosterName",
+        "boosterIndex",
+        "sheetName",
+        "sheetPicks",
+    )
+    booster_weights_columns = (
+        "setCode",
+        "boosterName",
+        "boosterIndex",
+        "boosterWeight",
+    )
+    booster_sheets_columns = (
+        "setCode",
+        "sheetName",
+        "boosterName",
+        "sheetIsFoil",
+        "sheetHasBalanceColors",
+    )
+    booster_sheet_cards_columns = (
+        "setCode",
+        "sheetName",
+        "boosterName",
+        "cardUuid",
+        "cardWeight",
+    )
+    booster_weight_range_columns = (
+        "setCode",
+        "boosterName",
+        "boosterIndex",
+        "boosterWeight",
+        "rangeStart",
+        "rangeEnd",
+    )
+    booster_weight_total_columns = (
+        "setCode",
+        "boosterName",
+        "totalWeight",
+        "boosterCount",
+    )
+    booster_sheet_card_range_columns = (
+        "setCode",
+        "boosterName",
+        "sheetName",
+        "cardUuid",
+        "cardWeight",
+        "rangeStart",
+        "rangeEnd",
+    )
+    booster_sheet_total_columns = (
+        "setCode",
+        "boosterName",
+        "sheetName",
+        "totalWeight",
+        "cardCount",
+    )
+
+    # Cumulative weight tables for pack simulation, only built on request
+    booster_sampling_tables = (
+        "setBoosterContentWeightRanges",
+        "setBoosterWeightTotals",
+        "setBoosterSheetCardRanges",
+        "setBoosterSheetTotals",
+    )
+
+    # Foreign data fields that get moved into foreignTexts, and the
+    # cardForeignData columns that reference them instead
+    foreign_text_keys = {"flavorText": "flavorTextId", "text": "textId"}
+
     def __init__(
-        self, mtgjson_data: Dict[str, Any], output_dir: str, data_type: MtgjsonDataType
+        self,
+        mtgjson_data: Dict[str, Any],
+        output_dir: str,
+        data_type: MtgjsonDataType,
+        options: Optional[ConverterOptions] = None,
     ) -> None:
         self.mtgjson_data = mtgjson_data
         self.output_obj = OutputObject(pathlib.Path(output_dir).expanduser())
         self.data_type = data_type
+        self.options = options or ConverterOptions()
+        self.manifest = BuildManifest()
 
     @abc.abstractmethod
     def convert(self) -> None:
         raise NotImplementedError()
 
+    def is_partitioned_table(self, table_name: str) -> bool:
+        return (
+            self.data_type in STREAMED_DATA_TYPES
+            and table_name in self.partitioned_tables
+        )
+
+    def get_checkpoint_step(self, step_name: str) -> Optional[Dict[str, Any]]:
+        if self.options.checkpoint is None:
+            return None
+        return self.options.checkpoint.get_step(type(self).__name__, step_name)
+
+    def is_checkpoint_step_complete(self, step_name: str) -> bool:
+        return self.get_checkpoint_step(step_name) is not None
+
+    def mark_checkpoint_step_complete(
+        self, step_name: str, **step_details: Any
+    ) -> None:
+        # Tables seen so far go along, as a resumed run won't see them again
+        if self.options.checkpoint is not None:
+            self.options.checkpoint.mark_step_complete(
+                type(self).__name__,
+                step_name,
+                **step_details,
+                manifestTables=self.manifest.get_table_entries(),
+            )
+
+    def discard_stale_checkpoint(self, output_path: pathlib.Path) -> None:
+        # Progress recorded against output that has since gone is worthless
+        if self.options.checkpoint is not None and not output_path.exists():
+            self.options.checkpoint.reset_converter(type(self).__name__)
+
+    def get_checkpoint_resume_offset(self) -> Optional[int]:
+        if self.options.checkpoint is None:
+            return None
+        return self.options.checkpoint.get_resume_offset(type(self).__name__)
+
+    def get_manifest_path(self) -> pathlib.Path:
+        return self.output_obj.root_dir.joinpath(
+            "manifests", f"{self.data_type.value}.{type(self).__name__}.json"
+        )
+
+    def write_manifest(self) -> Optional[pathlib.Path]:
+        if not self.options.manifests:
+            return None
+
+        if self.options.checkpoint is not None:
+            for step in self.options.checkpoint.get_steps(type(self).__name__).values():
+                self.manifest.restore_table_entries(step.get("manifestTables", {}))
+
+        manifest_path = self.get_manifest_path()
+        self.manifest.save(
+            manifest_path,
+            dataType=self.data_type.value,
+            converter=type(self).__name__,
+            version=self.get_version(),
+        )
+        return manifest_path
+
     def get_metadata(self) -> Iterator[Dict[str, Any]]:
-        yield self.mtgjson_data.get("meta", {})
+        if self.options.shard_name is None:
+            yield self.mtgjson_data.get("meta", {})
+            return
+
+        # Shards also record which shard they are & the sets they hold
+        yield {
+            **self.mtgjson_data.get("meta", {}),
+            "shard": self.options.shard_name,
+            "setCodes": ", ".join(self.mtgjson_data["data"].keys()),
+        }
 
     def get_version(self) -> Optional[str]:
         return str(self.mtgjson_data["meta"]["version"])
 
-    def get_next_set(self) -> Iterator[Dict[str, Any]]:
+    def get_next_meta(self, columns: Sequence[str]) -> Iterator[Row]:
+        for meta_data in self.get_metadata():
+            yield tuple(map(meta_data.get, columns))
+
+    def get_next_set(self, columns: Sequence[str]) -> Iterator[Row]:
         for set_data in self.mtgjson_data["data"].values():
-            local_set_data = {}
-            for key, value in set_data.items():
-                if key not in self.set_keys_to_skip:
-                    local_set_data[key] = value
-            yield local_set_data
+            yield tuple(map(set_data.get, columns))
 
     def get_next_set_field_with_normalization(
         self, set_attribute: str
-    ) -> Iterator[Dict[str, Any]]:
+    ) -> Iterator[Row]:
+        # Rows follow set_translation_columns
         for set_code, set_data in self.mtgjson_data["data"].items():
             if not set_data.get(set_attribute):
                 continue
 
             for language, translation in set_data[set_attribute].items():
-                yield {
-                    "language": language,
-                    "setCode": set_code,
-                    "translation": translation
-                }
+                yield language, set_code, translation
 
-    def get_next_card_like(self, set_attribute: str) -> Iterator[Dict[str, Any]]:
+    def get_next_card_like(
+        self, set_attribute: str, columns: Sequence[str]
+    ) -> Iterator[Row]:
         for set_data in self.mtgjson_data["data"].values():
             for card in set_data.get(set_attribute):
-                local_card = {}
-                for key, value in card.items():
-                    if key not in self.card_keys_to_skip:
-                        local_card[key] = value
-                yield local_card
+                yield tuple(map(card.get, columns))
 
-    def get_next_card_identifier(self, set_attribute: str) -> Iterator[Dict[str, Any]]:
-        return self.get_next_card_field_with_normalization(set_attribute, "identifiers")
+    def get_next_card_identifier(
+        self, set_attribute: str, columns: Sequence[str]
+    ) -> Iterator[Row]:
+        return self.get_next_card_field_with_normalization(
+            set_attribute, "identifiers", columns
+        )
 
-    def get_next_card_legalities(self, set_attribute: str) -> Iterator[Dict[str, Any]]:
-        return self.get_next_card_field_with_normalization(set_attribute, "legalities")
+    def get_next_card_legalities(
+        self, set_attribute: str, columns: Sequence[str]
+    ) -> Iterator[Row]:
+        return self.get_next_card_field_with_normalization(
+            set_attribute, "legalities", columns
+        )
 
     def get_next_card_ruling_entry(
-        self, set_attribute: str
-    ) -> Iterator[Dict[str, Any]]:
-        return self.get_next_card_field_with_normalization(set_attribute, "rulings")
+        self, set_attribute: str, columns: Sequence[str]
+    ) -> Iterator[Row]:
+        return self.get_next_card_field_with_normalization(
+            set_attribute, "rulings", columns
+        )
+
+    def get_next_ruling(self, set_attribute: str) -> Iterator[Row]:
+        # Rows follow ruling_columns, one per distinct ruling
+        seen_ruling_ids: Set[str] = set()
+        for ruling, _ in self.__get_next_card_sub_entity(set_attribute, "rulings"):
+            ruling_id = self.get_content_id(ruling.get("date"), ruling.get("text"))
+            if ruling_id in seen_ruling_ids:
+                continue
+
+            seen_ruling_ids.add(ruling_id)
+            yield ruling_id, ruling.get("date"), ruling.get("text")
+
+    def get_next_card_ruling_link(self, set_attribute: str) -> Iterator[Row]:
+        # Rows follow card_ruling_link_columns
+        for ruling, card in self.__get_next_card_sub_entity(set_attribute, "rulings"):
+            yield card.get("uuid"), self.get_content_id(
+                ruling.get("date"), ruling.get("text")
+            )
 
     def get_next_card_foreign_data_entry(
-        self, set_attribute: str
-    ) -> Iterator[Dict[str, Any]]:
-        return self.get_next_card_field_with_normalization(set_attribute, "foreignData")
+        self, set_attribute: str, columns: Sequence[str]
+    ) -> Iterator[Row]:
+        if self.options.deduplicate_foreign_text:
+            return self.get_next_card_field_with_normalization(
+                set_attribute, "foreignData", columns, self.__with_foreign_text_ids
+            )
+        return self.get_next_card_field_with_normalization(
+            set_attribute, "foreignData", columns
+        )
+
+    def get_next_foreign_text(self, set_attribute: str) -> Iterator[Row]:
+        # Rows follow foreign_text_columns, one per distinct text
+        seen_text_ids: Set[str] = set()
+        for foreign_data, _ in self.__get_next_card_sub_entity(
+            set_attribute, "foreignData"
+        ):
+            for text_key in self.foreign_text_keys:
+                text = foreign_data.get(text_key)
+                if text is None:
+                    continue
+
+                text_id = self.get_content_id(text)
+                if text_id in seen_text_ids:
+                    continue
+
+                seen_text_ids.add(text_id)
+                yield text_id, text
+
+    def __with_foreign_text_ids(self, foreign_data: Dict[str, Any]) -> Dict[str, Any]:
+        local_foreign_data = dict(foreign_data)
+        for text_key, text_id_key in self.foreign_text_keys.items():
+            text = local_foreign_data.pop(text_key, None)
+            if text is not None:
+                local_foreign_data[text_id_key] = self.get_content_id(text)
+        return local_foreign_data
+
+    @staticmethod
+    def get_content_id(*contents: Optional[str]) -> str:
+        return hashlib.sha1(
+            "\x00".join(str(content) for content in contents).encode("utf-8")
+        ).hexdigest()
 
     def get_next_card_purchase_url_entry(
-        self, set_attribute: str
-    ) -> Iterator[Dict[str, Any]]:
+        self, set_attribute: str, columns: Sequence[str]
+    ) -> Iterator[Row]:
         return self.get_next_card_field_with_normalization(
-            set_attribute, "purchaseUrls"
+            set_attribute, "purchaseUrls", columns
         )
 
     def get_next_card_field_with_normalization(
+        self,
+        set_attribute: str,
+        secondary_attribute: str,
+        columns: Sequence[str],
+        sub_entity_transformer: Optional[
+            Callable[[Dict[str, Any]], Dict[str, Any]]
+        ] = None,
+    ) -> Iterator[Row]:
+        # The card's uuid is spliced into its column slot rather than being
+        # written into the sub-entity, so the input data is never mutated
+        uuid_index = list(columns).index("uuid")
+        columns_before_uuid = columns[:uuid_index]
+        columns_after_uuid = columns[uuid_index + 1 :]
+
+        for sub_entity, card in self.__get_next_card_sub_entity(
+            set_attribute, secondary_attribute
+        ):
+            if sub_entity_transformer:
+                sub_entity = sub_entity_transformer(sub_entity)
+
+            yield (
+                *map(sub_entity.get, columns_before_uuid),
+                card.get("uuid"),
+                *map(sub_entity.get, columns_after_uuid),
+            )
+
+    def __get_next_card_sub_entity(
         self, set_attribute: str, secondary_attribute: str
-    ) -> Iterator[Dict[str, Any]]:
+    ) -> Iterator[Tuple[Dict[str, Any], Dict[str, Any]]]:
         for set_data in self.mtgjson_data["data"].values():
             for card in set_data.get(set_attribute):
                 if secondary_attribute not in card:
                     continue
 
-                if isinstance(card[secondary_attribute], list):
-                    for sub_entity in card[secondary_attribute]:
-                        yield self.__camelize_and_normalize_card(sub_entity, card)
-                else:
-                    yield self.__camelize_and_normalize_card(
-                        card[secondary_attribute], card
-                    )
+                sub_entities = card[secondary_attribute]
+                if not isinstance(sub_entities, list):
+                    sub_entities = [sub_entities]
 
-    @staticmethod
-    def __camelize_and_normalize_card(
-        entity: Dict[str, Any], card: Dict[str, Any]
-    ) -> Dict[str, Any]:
-        entity["uuid"] = card.get("uuid")
-        return entity
+                for sub_entity in sub_entities:
+                    yield sub_entity, card
 
     def get_next_card_price(
         self,
-        oldest_date: datetime.date,
-    ) -> Iterator[Dict[str, str]]:
-        oldest_date_str = str(oldest_date)
+        oldest_date: Optional[datetime.date],
+        newest_date: Optional[datetime.date] = None,
+    ) -> Iterator[Row]:
+        # Rows follow card_price_columns
+        oldest_date_str = str(oldest_date) if oldest_date else ""
+        newest_date_str = str(newest_date) if newest_date else "9999-12-31"
 
         for card_uuid, card_uuid_data in self.mtgjson_data["data"].items():
             for game_availability, game_availability_data in card_uuid_data.items():
@@ -156,66 +475,116 @@ class AbstractConverter(abc.ABC):
                             card_finish_data,
                         ) in provider_listing_data.items():
                             for price_date, price_amount in card_finish_data.items():
-                                if price_date < oldest_date_str:
+                                if not (
+                                    oldest_date_str <= price_date <= newest_date_str
+                                ):
                                     continue
-                                yield {
-                                    "uuid": card_uuid,
-                                    "gameAvailability": game_availability,
-                                    "priceProvider": price_provider,
-                                    "providerListing": provider_listing,
-                                    "cardFinish": card_finish,
-                                    "date": price_date,
-                                    "price": price_amount,
-                                    "currency": currency,
-                                }
-
-    def get_next_booster_contents_entry(self) -> Iterator[Dict[str, str | int]]:
+                                yield (
+                                    card_uuid,
+                                    game_availability,
+                                    price_provider,
+                                    provider_listing,
+                                    card_finish,
+                                    price_date,
+                                    price_amount,
+                                    currency,
+                                )
+
+    def get_next_booster_contents_entry(self) -> Iterator[Row]:
+        # Rows follow booster_contents_columns
         for set_code, set_data in self.mtgjson_data["data"].items():
             for booster_name, booster_object in set_data.get("booster", {}).items():
                 for index, booster_contents in enumerate(booster_object["boosters"]):
                     for sheet_name, sheet_picks in booster_contents["contents"].items():
-                        yield {
-                            "setCode": set_code,
-                            "boosterName": booster_name,
-                            "boosterIndex": index,
-                            "sheetName": sheet_name,
-                            "sheetPicks": sheet_picks,
-                        }
-
-    def get_next_booster_weights_entry(self) -> Iterator[Dict[str, str | int]]:
+                        yield set_code, booster_name, index, sheet_name, sheet_picks
+
+    def get_next_booster_weights_entry(self) -> Iterator[Row]:
+        # Rows follow booster_weights_columns
         for set_code, set_data in self.mtgjson_data["data"].items():
             for booster_name, booster_object in set_data.get("booster", {}).items():
                 for index, booster_contents in enumerate(booster_object["boosters"]):
-                    yield {
-                        "setCode": set_code,
-                        "boosterName": booster_name,
-                        "boosterIndex": index,
-                        "boosterWeight": booster_contents["weight"],
-                    }
-
-    def get_next_booster_sheets_entry(self) -> Iterator[Dict[str, str | bool]]:
+                    yield set_code, booster_name, index, booster_contents["weight"]
+
+    def get_next_booster_sheets_entry(self) -> Iterator[Row]:
+        # Rows follow booster_sheets_columns
+        for set_code, set_data in self.mtgjson_data["data"].items():
+            for booster_name, booster_object in set_data.get("booster", {}).items():
+                for sheet_name, sheet_contents in booster_object["sheets"].items():
+                    yield (
+                        set_code,
+                        sheet_name,
+                        booster_name,
+                        sheet_contents.get("foil", False),
+                        sheet_contents.get("balanceColors", False),
+                    )
+
+    def get_next_booster_sheet_cards_entry(self) -> Iterator[Row]:
+        # Rows follow booster_sheet_cards_columns
         for set_code, set_data in self.mtgjson_data["data"].items():
             for booster_name, booster_object in set_data.get("booster", {}).items():
                 for sheet_name, sheet_contents in booster_object["sheets"].items():
-                    yield {
-                        "setCode": set_code,
-                        "sheetName": sheet_name,
-                        "boosterName": booster_name,
-                        "sheetIsFoil": sheet_contents.get("foil", False),
-                        "sheetHasBalanceColors": sheet_contents.get(
-                            "balanceColors", False
-                        ),
-                    }
-
-    def get_next_booster_sheet_cards_entry(self) -> Iterator[Dict[str, str | int]]:
+                    for card_uuid, card_weight in sheet_contents["cards"].items():
+                        yield set_code, sheet_name, booster_name, card_uuid, card_weight
+
+    # The range generators assign each entry a half-open [rangeStart, rangeEnd)
+    # slice of its group's total weight, so a weighted draw is a single lookup
+    # of a random integer in [0, totalWeight)
+
+    def get_next_booster_weight_range_entry(self) -> Iterator[Row]:
+        # Rows follow booster_weight_range_columns
+        for set_code, set_data in self.mtgjson_data["data"].items():
+            for booster_name, booster_object in set_data.get("booster", {}).items():
+                range_start = 0
+                for index, booster_contents in enumerate(booster_object["boosters"]):
+                    booster_weight = booster_contents["weight"]
+                    yield (
+                        set_code,
+                        booster_name,
+                        index,
+                        booster_weight,
+                        range_start,
+                        range_start + booster_weight,
+                    )
+                    range_start += booster_weight
+
+    def get_next_booster_weight_total_entry(self) -> Iterator[Row]:
+        # Rows follow booster_weight_total_columns
+        for set_code, set_data in self.mtgjson_data["data"].items():
+            for booster_name, booster_object in set_data.get("booster", {}).items():
+                yield (
+                    set_code,
+                    booster_name,
+                    sum(contents["weight"] for contents in booster_object["boosters"]),
+                    len(booster_object["boosters"]),
+                )
+
+    def get_next_booster_sheet_card_range_entry(self) -> Iterator[Row]:
+        # Rows follow booster_sheet_card_range_columns
         for set_code, set_data in self.mtgjson_data["data"].items():
             for booster_name, booster_object in set_data.get("booster", {}).items():
                 for sheet_name, sheet_contents in booster_object["sheets"].items():
+                    range_start = 0
                     for card_uuid, card_weight in sheet_contents["cards"].items():
-                        yield {
-                            "setCode": set_code,
-                            "sheetName": sheet_name,
-                            "boosterName": booster_name,
-                            "cardUuid": card_uuid,
-                            "cardWeight": card_weight,
-                        }
+                        yield (
+                            set_code,
+                            booster_name,
+                            sheet_name,
+                            card_uuid,
+                            card_weight,
+                            range_start,
+                            range_start + card_weight,
+                        )
+                        range_start += card_weight
+
+    def get_next_booster_sheet_total_entry(self) -> Iterator[Row]:
+        # Rows follow booster_sheet_total_columns
+        for set_code, set_data in self.mtgjson_data["data"].items():
+            for booster_name, booster_object in set_data.get("booster", {}).items():
+                for sheet_name, sheet_contents in booster_object["sheets"].items():
+                    yield (
+                        set_code,
+                        booster_name,
+                        sheet_name,
+                        sum(sheet_contents["cards"].values()),
+                        len(sheet_contents["cards"]),
+                    )
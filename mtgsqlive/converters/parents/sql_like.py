@@ -1,143 +1,904 @@
 import abc
 import datetime
-from collections import defaultdict
-from typing import Any, Dict, Iterator, List, Optional
+import functools
+import hashlib
+import logging
+import pathlib
+import re
+from collections import OrderedDict, defaultdict
+from typing import (
+    Any,
+    Callable,
+    Dict,
+    Iterator,
+    List,
+    Optional,
+    Sequence,
+    Set,
+    TextIO,
+    Tuple,
+)
 
-from ...enums import MtgjsonDataType
-from .abstract import AbstractConverter
+from ...enums import STREAMED_DATA_TYPES, MtgjsonDataType
+from ...utils import BackgroundWriter, SchemaCache, WriterStats, load_schema_file
+from .abstract import AbstractConverter, ConverterOptions, Row
+
+LOGGER = logging.getLogger(__name__)
 
 nested_dict: Any = lambda: defaultdict(nested_dict)
 
+UUID_PATTERN = re.compile(
+    r"[0-9a-f]{8}-[0-9a-f]{4}-[0-9a-f]{4}-[0-9a-f]{4}-[0-9a-f]{12}"
+)
+
+# Column types whose literals are stored as numbers, if they parse as one
+NUMERIC_COLUMN_TYPES = frozenset(["INTEGER", "BIGINT", "FLOAT", "BOOLEAN"])
+LITERAL_BOOLEANS = {"True": True, "False": False}
+
+# Adds a table's columns to the schema dict
+TableSchemaBuilder = Callable[[Dict[str, Any]], None]
+# Maps a table's schema columns to the column order & rows to insert
+TableRowFactory = Callable[[Tuple[str, ...]], Tuple[Sequence[str], Iterator[Row]]]
+
+
+def read_numeric_literal(value: Optional[str]) -> Any:
+    # Like SQLite's numeric affinity, text that isn't a number is kept as is
+    if value is None:
+        return None
+    if value in LITERAL_BOOLEANS:
+        return LITERAL_BOOLEANS[value]
+    try:
+        return int(value)
+    except ValueError:
+        pass
+    try:
+        return float(value)
+    except ValueError:
+        return value
+
 
 class SqlLikeConverter(AbstractConverter, abc.ABC):
+    # Table schema entries that describe constraints rather than columns
+    non_column_schema_keys = {"unique_constraint", "indexes"}
+    # Tables written with multi-row INSERT statements
+    batch_insert_tables = {"cardPrices"}
+    # Columns identifying one price series in the price summary tables
+    card_price_key_columns = (
+        "uuid",
+        "gameAvailability",
+        "priceProvider",
+        "providerListing",
+        "cardFinish",
+    )
+    # Schema builder of every table each data type can build, in build order
+    card_table_schema_builders = OrderedDict(
+        {
+            "meta": "_add_meta_table_schema",
+            "sets": "_add_set_table_schema",
+            "cards": "_add_card_table_schema",
+            "tokens": "_add_token_table_schema",
+            "cardIdentifiers": "_add_card_identifiers_table_schema",
+            "cardLegalities": "_add_card_legalities_table_schema",
+            "rulings": "_add_rulings_table_schema",
+            "cardRulings": "_add_card_rulings_table_schema",
+            "cardForeignData": "_add_card_foreign_data_table_schema",
+            "foreignTexts": "_add_foreign_texts_table_schema",
+            "cardPurchaseUrls": "_add_card_purchase_urls_table_schema",
+            "tokenIdentifiers": "_add_token_identifiers_table_schema",
+            "setTranslations": "_add_set_translation_table_schema",
+            "setBoosterContents": "_add_set_booster_contents_schema",
+            "setBoosterContentWeights": "_add_set_booster_content_weights_schema",
+            "setBoosterSheets": "_add_set_booster_sheets_schema",
+            "setBoosterSheetCards": "_add_set_booster_sheet_cards_schema",
+            "setBoosterContentWeightRanges": "_add_set_booster_content_weight_ranges_schema",
+            "setBoosterWeightTotals": "_add_set_booster_weight_totals_schema",
+            "setBoosterSheetCardRanges": "_add_set_booster_sheet_card_ranges_schema",
+            "setBoosterSheetTotals": "_add_set_booster_sheet_totals_schema",
+        }
+    )
+    price_table_schema_builders = OrderedDict(
+        {
+            "cardPrices": "_add_all_prices_schema",
+            "cardPricesLatest": "_add_card_prices_latest_schema",
+            "cardPricesSummary": "_add_card_prices_summary_schema",
+        }
+    )
+    # Tables whose columns are inferred from the input, not fixed by the options
+    input_inferred_tables = (
+        "sets",
+        "cards",
+        "tokens",
+        "cardIdentifiers",
+        "cardLegalities",
+        "cardForeignData",
+        "cardPurchaseUrls",
+        "tokenIdentifiers",
+    )
+    # Tables filled by INSERT ... SELECT once all rows are in
+    derived_tables = ("cardPricesLatest", "cardPricesSummary")
+    # Day windows aggregated by cardPricesSummary
+    card_price_summary_windows = (7, 14)
+    latest_price_date: Optional[str] = None
+    # Quote character wrapping the dialect's string literals
+    string_quote = '"'
+    # Longer strings (card text, ...) rarely repeat, so they are never cached
+    max_cached_literal_length = 64
+    # Characters of a TEXT column to index, for dialects that require a prefix
+    text_index_prefix_length: Optional[int] = None
+    writer_stats: WriterStats
+    cached_string_literal: Callable[[str], str]
+
+    def __init__(
+        self,
+        mtgjson_data: Dict[str, Any],
+        output_dir: str,
+        data_type: MtgjsonDataType,
+        options: Optional[ConverterOptions] = None,
+    ) -> None:
+        super().__init__(mtgjson_data, output_dir, data_type, options)
+        self.writer_stats = WriterStats()
+        # Wraps the static method, so the cache doesn't keep the converter alive
+        self.cached_string_literal = self.escape_string_literal
+        if self.options.escape_cache_size > 0:
+            self.cached_string_literal = functools.lru_cache(
+                maxsize=self.options.escape_cache_size
+            )(self.escape_string_literal)
+
     @abc.abstractmethod
-    def create_insert_statement_body(self, data: Dict[str, Any]) -> str:
+    def create_insert_statement_body(self, data: Row) -> str:
         raise NotImplementedError()
 
+    @staticmethod
+    @abc.abstractmethod
+    def decode_insert_statement_body(body: str) -> List[Optional[str]]:
+        # Reverses create_insert_statement_body(), giving each value's text
+        # or None for NULL
+        raise NotImplementedError()
+
+    @staticmethod
+    @abc.abstractmethod
+    def escape_string_literal(value: str) -> str:
+        # Escapes & quotes a string for the dialect
+        raise NotImplementedError()
+
+    def format_string_literal(self, value: str) -> str:
+        # Codes, rarities, languages, providers & such repeat millions of times,
+        # so their literals are memoized. uuids are unique & never need escaping
+        if len(value) == 36 and UUID_PATTERN.fullmatch(value):
+            return f"{self.string_quote}{value}{self.string_quote}"
+        if len(value) > self.max_cached_literal_length:
+            return self.escape_string_literal(value)
+        return self.cached_string_literal(value)
+
+    def log_escape_cache_stats(self) -> None:
+        cache_info = getattr(self.cached_string_literal, "cache_info", None)
+        if cache_info is None:
+            return
+
+        hits, misses, _, current_size = cache_info()
+        if hits + misses:
+            LOGGER.info(
+                f"{type(self).__name__} escape cache: {hits / (hits + misses):.1%} "
+                f"hit rate ({hits} hits, {misses} misses, {current_size} entries)"
+            )
+
     @abc.abstractmethod
     def write_statements_to_file(self, data_generator: Iterator[str]) -> None:
         raise NotImplementedError()
 
-    def generate_database_insert_statements(self) -> Iterator[str]:
-        if self.data_type == MtgjsonDataType.MTGJSON_CARDS:
-            generators = self.__get_mtgjson_card_generators()
-        elif self.data_type == MtgjsonDataType.MTGJSON_CARD_PRICES:
-            generators = self.__get_mtgjson_card_prices_generators()
-        else:
-            raise ValueError()
+    def write_statement_batches(
+        self,
+        data_generator: Iterator[str],
+        write_batch: Callable[[List[str]], Any],
+    ) -> None:
+        # Batches are written on a background thread while the next is built
+        if self.options.writer_queue_depth <= 0:
+            for statements in self.batch_statements(data_generator):
+                write_batch(statements)
+            return
 
-        for generator in generators:
-            for statement in generator:
-                yield statement
+        with BackgroundWriter(
+            write_batch, self.options.writer_queue_depth, self.writer_stats
+        ) as background_writer:
+            for statements in self.batch_statements(data_generator):
+                background_writer.submit(statements)
 
-    def __get_mtgjson_card_generators(self) -> List[Iterator[str]]:
-        return [
-            self.__generate_insert_statement("meta", self.get_metadata()),
-            self.__generate_insert_statement("sets", self.get_next_set()),
-            self.__generate_insert_statement("cards", self.get_next_card_like("cards")),
-            self.__generate_insert_statement(
-                "tokens", self.get_next_card_like("tokens")
-            ),
-            self.__generate_insert_statement(
-                "cardIdentifiers", self.get_next_card_identifier("cards")
-            ),
-            self.__generate_insert_statement(
-                "cardLegalities", self.get_next_card_legalities("cards")
-            ),
-            self.__generate_insert_statement(
-                "cardRulings", self.get_next_card_ruling_entry("cards")
-            ),
-            self.__generate_insert_statement(
-                "cardForeignData", self.get_next_card_foreign_data_entry("cards")
-            ),
-            self.__generate_insert_statement(
-                "cardPurchaseUrls", self.get_next_card_purchase_url_entry("cards")
-            ),
-            self.__generate_insert_statement(
-                "tokenIdentifiers", self.get_next_card_identifier("tokens")
-            ),
-            self.__generate_insert_statement(
-                "setTranslations",
-                self.get_next_set_field_with_normalization("translations"),
-            ),
-            self.__generate_insert_statement(
-                "setBoosterContents", self.get_next_booster_contents_entry()
-            ),
-            self.__generate_insert_statement(
-                "setBoosterContentWeights", self.get_next_booster_weights_entry()
-            ),
-            self.__generate_insert_statement(
-                "setBoosterSheets", self.get_next_booster_sheets_entry()
-            ),
-            self.__generate_insert_statement(
-                "setBoosterSheetCards", self.get_next_booster_sheet_cards_entry()
-            ),
+    @staticmethod
+    def format_date_literal(value: datetime.date) -> str:
+        return f"'{value}'"
+
+    @staticmethod
+    def batch_statements(
+        data_generator: Iterator[str],
+        max_statements: int = 1_000,
+        max_characters: int = 16 * 1024 * 1024,
+    ) -> Iterator[List[str]]:
+        # Multi-row statements can be large, so batches are capped by size too
+        statements: List[str] = []
+        statements_size = 0
+        for statement in data_generator:
+            statements.append(statement)
+            statements_size += len(statement)
+            if len(statements) >= max_statements or statements_size >= max_characters:
+                yield statements
+                statements = []
+                statements_size = 0
+        yield statements
+
+    def get_output_offset(self) -> Optional[int]:
+        # Where the output file stands, recorded so a resumed build can truncate it
+        self.output_obj.fp.flush()
+        return int(self.output_obj.fp.tell())
+
+    def open_resumable_output_file(self, output_path: pathlib.Path) -> TextIO:
+        # Resumed builds continue right after the last finished step, dropping
+        # whatever the interrupted step had written
+        self.discard_stale_checkpoint(output_path)
+        resume_offset = self.get_checkpoint_resume_offset()
+        if resume_offset is None:
+            return output_path.open("w", encoding="utf-8")
+
+        LOGGER.info(f"Resuming {output_path} from offset {resume_offset}")
+        output_fp = output_path.open("r+", encoding="utf-8")
+        output_fp.seek(resume_offset)
+        output_fp.truncate()
+        return output_fp
+
+    def clear_table(self, table_name: str) -> None:
+        # Converters writing into a live database drop partial rows here
+        pass
+
+    def create_deferred_indexes(self, schema: Dict[str, Any]) -> None:
+        # Converters writing into a live database build their indexes here,
+        # once every table is loaded but before the derived tables query them
+        pass
+
+    def write_tables_to_file(
+        self, schema: Dict[str, Any], skip_partitioned_tables: bool = False
+    ) -> None:
+        # Tables are written one at a time, so each finished table can be
+        # checkpointed and skipped when the build is resumed
+        for table_name, columns, row_bodies in self.get_table_row_bodies(schema):
+            if skip_partitioned_tables and self.is_partitioned_table(table_name):
+                continue
+
+            table_step = self.get_checkpoint_step(table_name)
+            if table_step is not None:
+                LOGGER.info(f"Skipping {table_name}, finished in a previous run")
+                # Derived tables still depend on what the skipped table saw
+                self.latest_price_date = table_step.get(
+                    "latestPriceDate", self.latest_price_date
+                )
+                continue
+
+            self.clear_table(table_name)
+            self.write_statements_to_file(
+                self.generate_table_insert_statements(table_name, columns, row_bodies)
+            )
+            step_details: Dict[str, Any] = {"offset": self.get_output_offset()}
+            if self.latest_price_date is not None:
+                step_details["latestPriceDate"] = self.latest_price_date
+            self.mark_checkpoint_step_complete(table_name, **step_details)
+
+        self.create_deferred_indexes(schema)
+
+        if not skip_partitioned_tables and not self.is_checkpoint_step_complete(
+            "derived"
+        ):
+            for table_name in self.derived_tables:
+                if table_name in schema:
+                    self.clear_table(table_name)
+            self.write_statements_to_file(
+                self.generate_derived_table_statements(schema)
+            )
+            self.mark_checkpoint_step_complete(
+                "derived", offset=self.get_output_offset()
+            )
+
+        if self.writer_stats.batches:
+            LOGGER.info(f"{type(self).__name__} writer: {self.writer_stats}")
+        self.log_escape_cache_stats()
+
+    def generate_database_insert_statements(
+        self, schema: Dict[str, Any], skip_partitioned_tables: bool = False
+    ) -> Iterator[str]:
+        for table_name, columns, row_bodies in self.get_table_row_bodies(schema):
+            if skip_partitioned_tables and self.is_partitioned_table(table_name):
+                continue
+
+            yield from self.generate_table_insert_statements(
+                table_name, columns, row_bodies
+            )
+
+        if not skip_partitioned_tables:
+            yield from self.generate_derived_table_statements(schema)
+
+    def generate_table_insert_statements(
+        self,
+        table_name: str,
+        columns: Sequence[str],
+        row_bodies: Iterator[Tuple[Row, str]],
+    ) -> Iterator[str]:
+        if table_name in self.batch_insert_tables:
+            return self.__generate_batch_insert_statement(
+                table_name, columns, row_bodies
+            )
+        return self.__generate_insert_statement(table_name, columns, row_bodies)
+
+    def generate_partitioned_insert_statements(
+        self, schema: Dict[str, Any]
+    ) -> Iterator[Tuple[str, str]]:
+        # Yields (month, statement) pairs for the partitioned tables, batching
+        # rows per month so each statement belongs to exactly one partition.
+        # Derived table statements follow in a final "derived" partition
+        for table_name, columns, row_bodies in self.get_table_row_bodies(schema):
+            if not self.is_partitioned_table(table_name):
+                continue
+
+            partition_index = list(columns).index(self.partitioned_tables[table_name])
+            statement_prefix = f"INSERT INTO {table_name} ({', '.join(columns)}) VALUES"
+            partition_values: Dict[str, List[str]] = defaultdict(list)
+            for row, body in row_bodies:
+                partition = str(row[partition_index])[:7]
+                insert_values = partition_values[partition]
+                insert_values.append(f"({body})")
+
+                if len(insert_values) >= 2_000:
+                    yield_values = ",\n".join(insert_values)
+                    insert_values.clear()
+                    yield partition, f"{statement_prefix}\n{yield_values};\n"
+
+            for partition, insert_values in partition_values.items():
+                if insert_values:
+                    yield_values = ",\n".join(insert_values)
+                    yield partition, f"{statement_prefix}\n{yield_values};\n"
+
+        # Derived tables can only be computed once every partition is loaded
+        for statement in self.generate_derived_table_statements(schema):
+            yield "derived", statement
+
+    def write_partitioned_statements_to_files(
+        self,
+        partitioned_statements: Iterator[Tuple[str, str]],
+        file_extension: str,
+        session_statements: Sequence[str] = (),
+    ) -> None:
+        partition_dir = self.output_obj.root_dir.joinpath(self.data_type.value)
+        partition_dir.mkdir(parents=True, exist_ok=True)
+
+        partition_fps: Dict[str, TextIO] = {}
+        try:
+            for partition, statement in partitioned_statements:
+                if partition not in partition_fps:
+                    partition_fps[partition] = self.__open_partition_file(
+                        partition_dir, partition, file_extension, session_statements
+                    )
+                partition_fps[partition].write(statement)
+
+            for partition_fp in partition_fps.values():
+                partition_fp.write("\nCOMMIT;\n")
+        finally:
+            for partition_fp in partition_fps.values():
+                partition_fp.close()
+
+        LOGGER.info(
+            f"Wrote {len(partition_fps)} {self.data_type.value} partitions to {partition_dir}"
+        )
+
+    def __open_partition_file(
+        self,
+        partition_dir: pathlib.Path,
+        partition: str,
+        file_extension: str,
+        session_statements: Sequence[str],
+    ) -> TextIO:
+        partition_fp = partition_dir.joinpath(
+            f"{self.data_type.value}_{partition}.{file_extension}"
+        ).open("w", encoding="utf-8")
+        partition_fp.write(
+            "\n".join(
+                (
+                    "-- MTGSQLive Output File",
+                    f"-- {datetime.datetime.now().strftime('%Y-%m-%d %H:%M:%S')}",
+                    f"-- MTGJSON Version: {self.get_version()}",
+                    f"-- Partition: {partition}",
+                    "",
+                    "START TRANSACTION;",
+                    *session_statements,
+                    "",
+                    "",
+                )
+            )
+        )
+        return partition_fp
+
+    def get_table_rows(
+        self, schema: Dict[str, Any]
+    ) -> Iterator[Tuple[str, Sequence[str], Iterator[Row]]]:
+        # Only tables present in the schema are generated, so tables that were
+        # never selected are never traversed
+        for table_name, row_factory in self.__get_table_row_factories().items():
+            if table_name not in schema:
+                continue
+
+            columns, rows = row_factory(self._get_table_columns(schema[table_name]))
+            yield table_name, columns, rows
+
+    def get_table_row_bodies(
+        self, schema: Dict[str, Any]
+    ) -> Iterator[Tuple[str, Sequence[str], Iterator[Tuple[Row, str]]]]:
+        # Pairs each row with its insert statement body. Manifests are taken
+        # from the bodies, read back the way the database would store them
+        for table_name, columns, rows in self.get_table_rows(schema):
+            row_bodies: Iterator[Tuple[Row, str]] = (
+                (row, self.create_insert_statement_body(row)) for row in rows
+            )
+            if self.options.manifests:
+                row_bodies = self.manifest.track_rows(
+                    table_name,
+                    columns,
+                    row_bodies,
+                    self.__get_manifest_row_reader(schema[table_name], columns),
+                )
+            yield table_name, columns, row_bodies
+
+    def __get_manifest_row_reader(
+        self, table_data: Dict[str, Any], columns: Sequence[str]
+    ) -> Callable[[Tuple[Row, str]], List[Any]]:
+        value_readers = [
+            self.__get_stored_value_reader(table_data[column]["type"])
+            for column in columns
+        ]
+        return lambda row_body: [
+            read_value(value)
+            for read_value, value in zip(
+                value_readers, self.decode_insert_statement_body(row_body[1])
+            )
         ]
 
-    def __get_mtgjson_card_prices_generators(self) -> List[Iterator[str]]:
-        return [
-            self.__generate_batch_insert_statement(
-                "cardPrices",
-                self.get_next_card_price(
-                    datetime.date.today() - datetime.timedelta(days=14)
+    @staticmethod
+    def __get_stored_value_reader(
+        column_type: str,
+    ) -> Callable[[Optional[str]], Any]:
+        # Literals are text, the column type decides what the database keeps
+        if column_type.split("(")[0].split()[0].upper() in NUMERIC_COLUMN_TYPES:
+            return read_numeric_literal
+        return lambda value: value
+
+    def __get_table_row_factories(self) -> Dict[str, TableRowFactory]:
+        if self.data_type == MtgjsonDataType.MTGJSON_CARDS:
+            return self.__get_mtgjson_card_row_factories()
+        if self.data_type in (
+            MtgjsonDataType.MTGJSON_CARD_PRICES,
+            MtgjsonDataType.MTGJSON_ALL_PRICES,
+        ):
+            return self.__get_mtgjson_card_prices_row_factories()
+        raise ValueError()
+
+    def __get_mtgjson_card_row_factories(self) -> Dict[str, TableRowFactory]:
+        return OrderedDict(
+            {
+                "meta": lambda columns: (columns, self.get_next_meta(columns)),
+                "sets": lambda columns: (columns, self.get_next_set(columns)),
+                "cards": lambda columns: (
+                    columns,
+                    self.get_next_card_like("cards", columns),
+                ),
+                "tokens": lambda columns: (
+                    columns,
+                    self.get_next_card_like("tokens", columns),
+                ),
+                "cardIdentifiers": lambda columns: (
+                    columns,
+                    self.get_next_card_identifier("cards", columns),
+                ),
+                "cardLegalities": lambda columns: (
+                    columns,
+                    self.get_next_card_legalities("cards", columns),
+                ),
+                "rulings": lambda _: (
+                    self.ruling_columns,
+                    self.get_next_ruling("cards"),
+                ),
+                "cardRulings": self.__get_card_rulings_rows,
+                "cardForeignData": lambda columns: (
+                    columns,
+                    self.get_next_card_foreign_data_entry("cards", columns),
+                ),
+                "foreignTexts": lambda _: (
+                    self.foreign_text_columns,
+                    self.get_next_foreign_text("cards"),
+                ),
+                "cardPurchaseUrls": lambda columns: (
+                    columns,
+                    self.get_next_card_purchase_url_entry("cards", columns),
+                ),
+                "tokenIdentifiers": lambda columns: (
+                    columns,
+                    self.get_next_card_identifier("tokens", columns),
+                ),
+                "setTranslations": lambda _: (
+                    self.set_translation_columns,
+                    self.get_next_set_field_with_normalization("translations"),
+                ),
+                "setBoosterContents": lambda _: (
+                    self.booster_contents_columns,
+                    self.get_next_booster_contents_entry(),
+                ),
+                "setBoosterContentWeights": lambda _: (
+                    self.booster_weights_columns,
+                    self.get_next_booster_weights_entry(),
+                ),
+                "setBoosterSheets": lambda _: (
+                    self.booster_sheets_columns,
+                    self.get_next_booster_sheets_entry(),
                 ),
+                "setBoosterSheetCards": lambda _: (
+                    self.booster_sheet_cards_columns,
+                    self.get_next_booster_sheet_cards_entry(),
+                ),
+                "setBoosterContentWeightRanges": lambda _: (
+                    self.booster_weight_range_columns,
+                    self.get_next_booster_weight_range_entry(),
+                ),
+                "setBoosterWeightTotals": lambda _: (
+                    self.booster_weight_total_columns,
+                    self.get_next_booster_weight_total_entry(),
+                ),
+                "setBoosterSheetCardRanges": lambda _: (
+                    self.booster_sheet_card_range_columns,
+                    self.get_next_booster_sheet_card_range_entry(),
+                ),
+                "setBoosterSheetTotals": lambda _: (
+                    self.booster_sheet_total_columns,
+                    self.get_next_booster_sheet_total_entry(),
+                ),
+            }
+        )
+
+    def __get_card_rulings_rows(
+        self, columns: Sequence[str]
+    ) -> Tuple[Sequence[str], Iterator[Row]]:
+        if self.options.deduplicate_rulings:
+            return self.card_ruling_link_columns, self.get_next_card_ruling_link(
+                "cards"
             )
+        return columns, self.get_next_card_ruling_entry("cards", columns)
+
+    def __get_mtgjson_card_prices_row_factories(self) -> Dict[str, TableRowFactory]:
+        return OrderedDict(
+            {
+                "cardPrices": lambda _: (
+                    self.card_price_columns,
+                    self.__track_latest_price_date(
+                        self.get_next_card_price(
+                            *self.options.get_price_date_range(self.data_type)
+                        )
+                    ),
+                ),
+            }
+        )
+
+    def __track_latest_price_date(self, rows: Iterator[Row]) -> Iterator[Row]:
+        # The price summaries are relative to the newest price written
+        date_index = self.card_price_columns.index("date")
+        for row in rows:
+            if (
+                self.latest_price_date is None
+                or row[date_index] > self.latest_price_date
+            ):
+                self.latest_price_date = row[date_index]
+            yield row
+
+    def generate_derived_table_statements(
+        self, schema: Dict[str, Any]
+    ) -> Iterator[str]:
+        if "cardPricesLatest" in schema:
+            yield from self.__generate_card_prices_latest_statement()
+        if "cardPricesSummary" in schema:
+            yield from self.__generate_card_prices_summary_statement()
+
+    def __generate_card_prices_latest_statement(self) -> Iterator[str]:
+        if self.latest_price_date is None:
+            return
+
+        key_columns = ", ".join(self.card_price_key_columns)
+        join_condition = " AND ".join(
+            f"p.{column} = l.{column}" for column in self.card_price_key_columns
+        )
+        yield (
+            f"INSERT INTO cardPricesLatest ({key_columns}, currency, date, price)\n"
+            f"SELECT {', '.join(f'p.{column}' for column in self.card_price_key_columns)}, "
+            "p.currency, p.date, p.price\n"
+            "FROM cardPrices p\n"
+            f"JOIN (SELECT {key_columns}, MAX(date) AS latestDate "
+            f"FROM cardPrices GROUP BY {key_columns}) l\n"
+            f"ON {join_condition} AND p.date = l.latestDate;\n"
+        )
+
+    def __generate_card_prices_summary_statement(self) -> Iterator[str]:
+        if self.latest_price_date is None:
+            return
+
+        as_of_date = datetime.date.fromisoformat(self.latest_price_date)
+        aggregates: List[str] = []
+        for days in self.card_price_summary_windows:
+            # Windows include the as-of date, so 7 days spans as_of_date - 6 .. as_of_date
+            window_start = as_of_date - datetime.timedelta(days=days - 1)
+            windowed_price = (
+                f"CASE WHEN date >= {self.format_date_literal(window_start)} "
+                "THEN price END"
+            )
+            aggregates.extend(
+                (
+                    f"MIN({windowed_price})",
+                    f"MAX({windowed_price})",
+                    f"AVG({windowed_price})",
+                )
+            )
+
+        oldest_date = as_of_date - datetime.timedelta(
+            days=max(self.card_price_summary_windows) - 1
+        )
+        key_columns = ", ".join(self.card_price_key_columns)
+        summary_columns = ", ".join(self.__get_card_price_summary_columns())
+        yield (
+            f"INSERT INTO cardPricesSummary ({key_columns}, currency, asOfDate, {summary_columns})\n"
+            f"SELECT {key_columns}, currency, {self.format_date_literal(as_of_date)}, "
+            f"{', '.join(aggregates)}\n"
+            "FROM cardPrices\n"
+            f"WHERE date >= {self.format_date_literal(oldest_date)} "
+            f"AND date <= {self.format_date_literal(as_of_date)}\n"
+            f"GROUP BY {key_columns}, currency;\n"
+        )
+
+    def __get_card_price_summary_columns(self) -> List[str]:
+        return [
+            f"price{days}Day{aggregate}"
+            for days in self.card_price_summary_windows
+            for aggregate in ("Min", "Max", "Avg")
         ]
 
     def __generate_insert_statement(
-        self, table_name: str, data_generator: Iterator[Dict[str, Any]]
+        self,
+        table_name: str,
+        columns: Sequence[str],
+        row_bodies: Iterator[Tuple[Row, str]],
     ) -> Iterator[str]:
-        for obj in data_generator:
-            data_keys = ", ".join(obj.keys())
-            safe_values = self.create_insert_statement_body(obj)
-            yield f"INSERT INTO {table_name} ({data_keys}) VALUES ({safe_values});\n"
+        statement_prefix = f"INSERT INTO {table_name} ({', '.join(columns)}) VALUES"
+        for _, safe_values in row_bodies:
+            yield f"{statement_prefix} ({safe_values});\n"
 
     def __generate_batch_insert_statement(
-        self, table_name: str, data_generator: Iterator[Dict[str, Any]]
+        self,
+        table_name: str,
+        columns: Sequence[str],
+        row_bodies: Iterator[Tuple[Row, str]],
     ) -> Iterator[str]:
+        statement_prefix = f"INSERT INTO {table_name} ({', '.join(columns)}) VALUES"
         insert_values = []
-        data_keys = ""
-        for obj in data_generator:
-            data_keys = ", ".join(obj.keys())
-            safe_values = f"({self.create_insert_statement_body(obj)})"
-            insert_values.append(safe_values)
+        for _, safe_values in row_bodies:
+            insert_values.append(f"({safe_values})")
 
             if len(insert_values) >= 2_000:
                 yield_values = ",\n".join(insert_values)
                 insert_values = []
-                yield f"INSERT INTO {table_name} ({data_keys}) VALUES\n{yield_values};\n"
+                yield f"{statement_prefix}\n{yield_values};\n"
 
-        yield_values = ",\n".join(insert_values)
-        yield f"INSERT INTO {table_name} ({data_keys}) VALUES\n{yield_values};\n"
+        if insert_values:
+            yield_values = ",\n".join(insert_values)
+            yield f"{statement_prefix}\n{yield_values};\n"
+
+    @classmethod
+    def _get_table_columns(cls, table_data: Dict[str, Any]) -> Tuple[str, ...]:
+        # Same ordering as the CREATE TABLE statement
+        return tuple(
+            attribute
+            for attribute in sorted(table_data.keys())
+            if attribute not in cls.non_column_schema_keys
+        )
 
     def _generate_sql_schema_dict(self) -> Dict[str, Any]:
+        schema = self.__load_sql_schema_dict()
+        self.__add_planned_indexes(schema)
+        return schema
+
+    def __add_planned_indexes(self, schema: Dict[str, Any]) -> None:
+        for table_name, planned_indexes in self.options.index_plan.items():
+            if table_name not in schema:
+                continue
+
+            table_data = schema[table_name]
+            table_columns = self._get_table_columns(table_data)
+            table_indexes = list(table_data.get("indexes", []))
+            for index_columns in planned_indexes:
+                missing_columns = set(index_columns).difference(table_columns)
+                if missing_columns:
+                    # e.g. a format no card in the selected sets has a legality for
+                    LOGGER.info(
+                        f"Skipping index on {table_name}({','.join(index_columns)}), "
+                        f"no column {', '.join(sorted(missing_columns))}"
+                    )
+                    continue
+                if list(index_columns) not in table_indexes:
+                    table_indexes.append(list(index_columns))
+
+            if table_indexes:
+                table_data["indexes"] = table_indexes
+
+    def __load_sql_schema_dict(self) -> Dict[str, Any]:
+        if self.options.schema_file:
+            pinned_schema = load_schema_file(self.options.schema_file)
+            # A pinned schema describes one data type, the others are inferred
+            if pinned_schema.keys() & self.__get_table_schema_builders().keys():
+                LOGGER.info(f"Using pinned schema {self.options.schema_file}")
+                schema = {
+                    table_name: table_data
+                    for table_name, table_data in pinned_schema.items()
+                    if self.options.is_table_selected(table_name)
+                }
+                self.__check_pinned_sql_schema_dict(schema)
+                return schema
+
+            LOGGER.info(
+                f"Pinned schema {self.options.schema_file} has no "
+                f"{self.data_type.value} tables, inferring one"
+            )
+
+        if not self.options.schema_cache_dir:
+            return self.__infer_sql_schema_dict()
+
+        schema_cache = SchemaCache(self.options.schema_cache_dir)
+        schema_cache_key = self.__get_schema_cache_key()
+        cached_schema = schema_cache.load(schema_cache_key)
+        if cached_schema is not None:
+            LOGGER.info(
+                f"Loaded {self.data_type.value} schema from "
+                f"{schema_cache.get_cache_path(schema_cache_key)}"
+            )
+            return cached_schema
+
+        schema = self.__infer_sql_schema_dict()
+        schema_cache.save(schema_cache_key, schema)
+        return schema
+
+    def __check_pinned_sql_schema_dict(self, schema: Dict[str, Any]) -> None:
+        # Rows are laid out by the options, not by the schema, so a schema
+        # pinned under other options can't be used for this build
+        schema_builders = {
+            table_name: schema_builder
+            for table_name, schema_builder in self.__get_table_schema_builders().items()
+            if self.options.is_table_selected(table_name)
+        }
+        mismatches = []
+        missing_table_names = sorted(schema_builders.keys() - schema.keys())
+        if missing_table_names:
+            mismatches.append(f"missing tables {', '.join(missing_table_names)}")
+        extra_table_names = sorted(schema.keys() - schema_builders.keys())
+        if extra_table_names:
+            mismatches.append(f"unexpected tables {', '.join(extra_table_names)}")
+
+        # Other tables' columns come from the input, so only the ones the
+        # options control can be checked
+        expected_schema = nested_dict()
+        for table_name, schema_builder in schema_builders.items():
+            if table_name in schema and table_name not in self.input_inferred_tables:
+                schema_builder(expected_schema)
+        for table_name, table_data in expected_schema.items():
+            expected_columns = set(self._get_table_columns(table_data))
+            pinned_columns = set(self._get_table_columns(schema[table_name]))
+            if pinned_columns != expected_columns:
+                mismatches.append(
+                    f"{table_name} has columns {', '.join(sorted(pinned_columns))}, "
+                    f"expected {', '.join(sorted(expected_columns))}"
+                )
+
+        if "cardForeignData" in schema and "cardForeignData" in schema_builders:
+            pinned_columns = set(self._get_table_columns(schema["cardForeignData"]))
+            text_id_columns = set(self.foreign_text_keys.values())
+            if self.options.deduplicate_foreign_text:
+                missing_columns = text_id_columns - pinned_columns
+                extra_columns = pinned_columns & self.foreign_text_keys.keys()
+            else:
+                missing_columns = set()
+                extra_columns = pinned_columns & text_id_columns
+            if missing_columns:
+                mismatches.append(
+                    f"cardForeignData is missing columns "
+                    f"{', '.join(sorted(missing_columns))}"
+                )
+            if extra_columns:
+                mismatches.append(
+                    f"cardForeignData has unexpected columns "
+                    f"{', '.join(sorted(extra_columns))}"
+                )
+
+        if mismatches:
+            raise ValueError(
+                f"Pinned schema {self.options.schema_file} doesn't match the "
+                f"selected options: {'; '.join(mismatches)}"
+            )
+
+    def __get_schema_cache_key(self) -> Dict[str, Any]:
+        # The inferred schema depends on the input contents, which sets were
+        # kept, and the options that shape the tables
+        data_keys_hash = None
+        if self.data_type not in STREAMED_DATA_TYPES:
+            data_keys_hash = hashlib.sha256(
+                "\n".join(sorted(self.mtgjson_data["data"].keys())).encode("utf-8")
+            ).hexdigest()
+        return {
+            "dataType": self.data_type.value,
+            "version": self.get_version(),
+            "inputHash": self.options.input_hash,
+            "dataKeysHash": data_keys_hash,
+            "options": self.options.get_schema_fingerprint(),
+        }
+
+    def __infer_sql_schema_dict(self) -> Dict[str, Any]:
         schema = nested_dict()
 
-        if self.data_type == MtgjsonDataType.MTGJSON_CARDS:
-            self._add_meta_table_schema(schema)
-            self._add_set_table_schema(schema)
-            self._add_card_table_schema(schema)
-            self._add_token_table_schema(schema)
-            self._add_card_identifiers_table_schema(schema)
-            self._add_card_legalities_table_schema(schema)
-            self._add_card_rulings_table_schema(schema)
-            self._add_card_foreign_data_table_schema(schema)
-            self._add_card_purchase_urls_table_schema(schema)
-            self._add_token_identifiers_table_schema(schema)
-            self._add_set_translation_table_schema(schema)
-            self._add_set_booster_contents_schema(schema)
-            self._add_set_booster_content_weights_schema(schema)
-            self._add_set_booster_sheets_schema(schema)
-            self._add_set_booster_sheet_cards_schema(schema)
-        elif self.data_type == MtgjsonDataType.MTGJSON_CARD_PRICES:
-            self._add_all_prices_schema(schema)
+        for table_name, schema_builder in self.__get_table_schema_builders().items():
+            if self.options.is_table_selected(table_name):
+                schema_builder(schema)
 
         return dict(schema)
 
-    @staticmethod
-    def _add_meta_table_schema(schema: Dict[str, Any]) -> None:
+    def __get_table_schema_builders(self) -> Dict[str, TableSchemaBuilder]:
+        if self.data_type == MtgjsonDataType.MTGJSON_CARDS:
+            schema_builders: Dict[str, TableSchemaBuilder] = OrderedDict(
+                (table_name, getattr(self, builder_name))
+                for table_name, builder_name in self.card_table_schema_builders.items()
+            )
+            if not self.options.deduplicate_rulings:
+                del schema_builders["rulings"]
+            if not self.options.deduplicate_foreign_text:
+                del schema_builders["foreignTexts"]
+            if not self.options.booster_sampling:
+                for table_name in self.booster_sampling_tables:
+                    del schema_builders[table_name]
+            return schema_builders
+
+        if self.data_type in (
+            MtgjsonDataType.MTGJSON_CARD_PRICES,
+            MtgjsonDataType.MTGJSON_ALL_PRICES,
+        ):
+            schema_builders = OrderedDict(
+                (table_name, getattr(self, builder_name))
+                for table_name, builder_name in self.price_table_schema_builders.items()
+            )
+            if not self.options.price_summaries:
+                del schema_builders["cardPricesLatest"]
+                del schema_builders["cardPricesSummary"]
+            return schema_builders
+
+        return OrderedDict()
+
+    @classmethod
+    def get_known_table_names(cls) -> Set[str]:
+        return set(cls.card_table_schema_builders) | set(
+            cls.price_table_schema_builders
+        )
+
+    @classmethod
+    def get_table_dependencies(cls, options: ConverterOptions) -> Dict[str, Set[str]]:
+        # Tables whose rows reference, or are selected from, other tables
+        table_dependencies: Dict[str, Set[str]] = {}
+        if options.price_summaries:
+            for table_name in cls.derived_tables:
+                table_dependencies[table_name] = {"cardPrices"}
+        if options.deduplicate_rulings:
+            table_dependencies["cardRulings"] = {"rulings"}
+        if options.deduplicate_foreign_text:
+            table_dependencies["cardForeignData"] = {"foreignTexts"}
+        return table_dependencies
+
+    def _add_meta_table_schema(self, schema: Dict[str, Any]) -> None:
         schema["meta"]["date"]["type"] = "DATE"
         schema["meta"]["version"]["type"] = "TEXT"
+        if self.options.shard_name is not None:
+            schema["meta"]["shard"]["type"] = "TEXT"
+            schema["meta"]["setCodes"]["type"] = "TEXT"
 
     def _add_set_table_schema(self, schema: Dict[str, Any]) -> None:
         for set_data in self.mtgjson_data["data"].values():
@@ -170,7 +931,18 @@ class SqlLikeConverter(AbstractConverter, abc.ABC):
         self._get_card_like_schema(schema, "tokens")
 
     @staticmethod
-    def _add_card_rulings_table_schema(schema: Dict[str, Any]) -> None:
+    def _add_rulings_table_schema(schema: Dict[str, Any]) -> None:
+        schema["rulings"]["rulingId"]["type"] = "VARCHAR(40) NOT NULL"
+        schema["rulings"]["date"]["type"] = "DATE"
+        schema["rulings"]["text"]["type"] = "TEXT"
+        schema["rulings"]["unique_constraint"] = ["rulingId"]
+
+    def _add_card_rulings_table_schema(self, schema: Dict[str, Any]) -> None:
+        if self.options.deduplicate_rulings:
+            schema["cardRulings"]["rulingId"]["type"] = "VARCHAR(40) NOT NULL"
+            schema["cardRulings"]["uuid"]["type"] = "VARCHAR(36) NOT NULL"
+            return
+
         schema["cardRulings"]["text"]["type"] = "TEXT"
         schema["cardRulings"]["date"]["type"] = "DATE"
         schema["cardRulings"]["uuid"]["type"] = "VARCHAR(36) NOT NULL"
@@ -208,6 +980,17 @@ class SqlLikeConverter(AbstractConverter, abc.ABC):
         )
         schema["cardForeignData"]["multiverseId"]["type"] = "INTEGER"
 
+        if self.options.deduplicate_foreign_text:
+            for text_key, text_id_key in self.foreign_text_keys.items():
+                schema["cardForeignData"].pop(text_key, None)
+                schema["cardForeignData"][text_id_key]["type"] = "VARCHAR(40)"
+
+    @staticmethod
+    def _add_foreign_texts_table_schema(schema: Dict[str, Any]) -> None:
+        schema["foreignTexts"]["textId"]["type"] = "VARCHAR(40) NOT NULL"
+        schema["foreignTexts"]["text"]["type"] = "TEXT"
+        schema["foreignTexts"]["unique_constraint"] = ["textId"]
+
     def _add_card_purchase_urls_table_schema(self, schema: Dict[str, Any]) -> None:
         return self.__add_card_field_with_normalization(
             "cardPurchaseUrls", schema, "purchaseUrls"
@@ -235,6 +1018,33 @@ class SqlLikeConverter(AbstractConverter, abc.ABC):
         schema["cardPrices"]["currency"]["type"] = "VARCHAR(10)"
         schema["cardPrices"]["uuid"]["type"] = "VARCHAR(36) NOT NULL"
 
+    @staticmethod
+    def _add_card_price_key_schema(schema: Dict[str, Any], table_name: str) -> None:
+        schema[table_name]["uuid"]["type"] = "VARCHAR(36) NOT NULL"
+        schema[table_name]["gameAvailability"]["type"] = "VARCHAR(15)"
+        schema[table_name]["priceProvider"]["type"] = "VARCHAR(20)"
+        schema[table_name]["providerListing"]["type"] = "VARCHAR(15)"
+        schema[table_name]["cardFinish"]["type"] = "VARCHAR(15)"
+        schema[table_name]["currency"]["type"] = "VARCHAR(10)"
+        schema[table_name]["unique_constraint"] = [
+            "uuid",
+            "gameAvailability",
+            "priceProvider",
+            "providerListing",
+            "cardFinish",
+        ]
+
+    def _add_card_prices_latest_schema(self, schema: Dict[str, Any]) -> None:
+        self._add_card_price_key_schema(schema, "cardPricesLatest")
+        schema["cardPricesLatest"]["date"]["type"] = "DATE"
+        schema["cardPricesLatest"]["price"]["type"] = "FLOAT"
+
+    def _add_card_prices_summary_schema(self, schema: Dict[str, Any]) -> None:
+        self._add_card_price_key_schema(schema, "cardPricesSummary")
+        schema["cardPricesSummary"]["asOfDate"]["type"] = "DATE"
+        for summary_column in self.__get_card_price_summary_columns():
+            schema["cardPricesSummary"][summary_column]["type"] = "FLOAT"
+
     @staticmethod
     def _add_set_booster_contents_schema(schema: Dict[str, Any]) -> None:
         schema["setBoosterContents"]["setCode"]["type"] = "VARCHAR(20)"
@@ -270,19 +1080,79 @@ class SqlLikeConverter(AbstractConverter, abc.ABC):
         schema["setBoosterSheetCards"]["unique_constraint"] = ["setCode", "sheetName", "boosterName", "cardUuid"]
 
     @staticmethod
+    def _add_set_booster_content_weight_ranges_schema(schema: Dict[str, Any]) -> None:
+        schema["setBoosterContentWeightRanges"]["setCode"]["type"] = "VARCHAR(20)"
+        schema["setBoosterContentWeightRanges"]["boosterName"]["type"] = "VARCHAR(255)"
+        schema["setBoosterContentWeightRanges"]["boosterIndex"]["type"] = "INTEGER"
+        schema["setBoosterContentWeightRanges"]["boosterWeight"]["type"] = "INTEGER"
+        schema["setBoosterContentWeightRanges"]["rangeStart"]["type"] = "BIGINT"
+        schema["setBoosterContentWeightRanges"]["rangeEnd"]["type"] = "BIGINT"
+        schema["setBoosterContentWeightRanges"]["unique_constraint"] = [
+            "setCode",
+            "boosterName",
+            "boosterIndex",
+        ]
+        schema["setBoosterContentWeightRanges"]["indexes"] = [
+            ["setCode", "boosterName", "rangeStart"]
+        ]
+
+    @staticmethod
+    def _add_set_booster_weight_totals_schema(schema: Dict[str, Any]) -> None:
+        schema["setBoosterWeightTotals"]["setCode"]["type"] = "VARCHAR(20)"
+        schema["setBoosterWeightTotals"]["boosterName"]["type"] = "VARCHAR(255)"
+        schema["setBoosterWeightTotals"]["totalWeight"]["type"] = "BIGINT"
+        schema["setBoosterWeightTotals"]["boosterCount"]["type"] = "INTEGER"
+        schema["setBoosterWeightTotals"]["unique_constraint"] = [
+            "setCode",
+            "boosterName",
+        ]
+
+    @staticmethod
+    def _add_set_booster_sheet_card_ranges_schema(schema: Dict[str, Any]) -> None:
+        schema["setBoosterSheetCardRanges"]["setCode"]["type"] = "VARCHAR(20)"
+        schema["setBoosterSheetCardRanges"]["boosterName"]["type"] = "VARCHAR(255)"
+        schema["setBoosterSheetCardRanges"]["sheetName"]["type"] = "VARCHAR(255)"
+        schema["setBoosterSheetCardRanges"]["cardUuid"]["type"] = "VARCHAR(36) NOT NULL"
+        schema["setBoosterSheetCardRanges"]["cardWeight"]["type"] = "BIGINT"
+        schema["setBoosterSheetCardRanges"]["rangeStart"]["type"] = "BIGINT"
+        schema["setBoosterSheetCardRanges"]["rangeEnd"]["type"] = "BIGINT"
+        schema["setBoosterSheetCardRanges"]["unique_constraint"] = [
+            "setCode",
+            "boosterName",
+            "sheetName",
+            "cardUuid",
+        ]
+        schema["setBoosterSheetCardRanges"]["indexes"] = [
+            ["setCode", "boosterName", "sheetName", "rangeStart"]
+        ]
+
+    @staticmethod
+    def _add_set_booster_sheet_totals_schema(schema: Dict[str, Any]) -> None:
+        schema["setBoosterSheetTotals"]["setCode"]["type"] = "VARCHAR(20)"
+        schema["setBoosterSheetTotals"]["boosterName"]["type"] = "VARCHAR(255)"
+        schema["setBoosterSheetTotals"]["sheetName"]["type"] = "VARCHAR(255)"
+        schema["setBoosterSheetTotals"]["totalWeight"]["type"] = "BIGINT"
+        schema["setBoosterSheetTotals"]["cardCount"]["type"] = "INTEGER"
+        schema["setBoosterSheetTotals"]["unique_constraint"] = [
+            "setCode",
+            "boosterName",
+            "sheetName",
+        ]
+
+    @classmethod
     def _convert_schema_dict_to_query(
+        cls,
         schema: Dict[str, Any],
         engine: str,
         primary_key_op: Optional[str],
+        include_indexes: bool = True,
     ) -> str:
         q = ""
         for table_name, table_data in schema.items():
             q += f"CREATE TABLE {table_name} (\n"
             if primary_key_op:
                 q += f"\tid {primary_key_op},\n"
-            for attribute in sorted(table_data.keys()):
-                if "unique_constraint" == attribute:
-                    continue
+            for attribute in cls._get_table_columns(table_data):
                 q += f"\t{attribute} {table_data[attribute]['type']},\n"
 
             if "unique_constraint" in table_data.keys():
@@ -290,11 +1160,53 @@ class SqlLikeConverter(AbstractConverter, abc.ABC):
 
             q = f"{q[:-2]}\n){engine};\n\n"
 
-            if "uuid" in table_data.keys():
-                q = f"{q[:-2]}\nCREATE INDEX {table_name}_uuid ON {table_name}(uuid);\n\n"
+            if include_indexes:
+                for index_query in cls._get_table_index_queries(table_name, table_data):
+                    q = f"{q[:-2]}\n{index_query}\n\n"
 
         return q[:-2]
 
+    @classmethod
+    def _get_table_index_queries(
+        cls, table_name: str, table_data: Dict[str, Any]
+    ) -> List[str]:
+        # Secondary indexes, which bulk loads can create after the data is in
+        table_indexes = [["uuid"]] if "uuid" in table_data.keys() else []
+        table_indexes.extend(
+            index_columns
+            for index_columns in table_data.get("indexes", [])
+            if index_columns not in table_indexes
+        )
+
+        index_queries = []
+        for index_columns in table_indexes:
+            indexed_columns = ",".join(
+                cls._get_index_column(table_data, column) for column in index_columns
+            )
+            index_queries.append(
+                f"CREATE INDEX {cls._get_index_name(table_name, index_columns)} "
+                f"ON {table_name}({indexed_columns});"
+            )
+        return index_queries
+
+    @classmethod
+    def _get_index_column(cls, table_data: Dict[str, Any], column: str) -> str:
+        # Dialects that can't index TEXT in full index a prefix of it instead
+        if cls.text_index_prefix_length is None:
+            return column
+        if table_data[column]["type"].split()[0].upper() != "TEXT":
+            return column
+        return f"{column}({cls.text_index_prefix_length})"
+
+    @staticmethod
+    def _get_index_name(table_name: str, index_columns: Sequence[str]) -> str:
+        # MySQL caps identifiers at 64 characters
+        index_name = f"{table_name}_{'_'.join(index_columns)}"
+        if len(index_name) <= 64:
+            return index_name
+        columns_hash = hashlib.sha1(index_name.encode()).hexdigest()[:8]
+        return f"{table_name[:55]}_{columns_hash}"
+
     @staticmethod
     def _get_sql_type(mixed: Any) -> Optional[str]:
         if isinstance(mixed, (str, list, dict)):
@@ -1,20 +1,24 @@
 import abc
-from typing import Any, Dict, List
+from typing import Any, Dict, Iterator, List, Optional
 
 import pandas as pd
 import sqlalchemy
 
 from ...enums import MtgjsonDataType
-from .abstract import AbstractConverter
+from .abstract import AbstractConverter, ConverterOptions
 
 
 class SqliteBasedConverter(AbstractConverter, abc.ABC):
     sqlite_engine: sqlalchemy.Engine
 
     def __init__(
-        self, mtgjson_data: Dict[str, Any], output_dir: str, data_type: MtgjsonDataType
+        self,
+        mtgjson_data: Dict[str, Any],
+        output_dir: str,
+        data_type: MtgjsonDataType,
+        options: Optional[ConverterOptions] = None,
     ) -> None:
-        super().__init__(mtgjson_data, output_dir, data_type)
+        super().__init__(mtgjson_data, output_dir, data_type, options)
 
         db_path = self.output_obj.root_dir.joinpath(f"{data_type.value}.sqlite")
         if not db_path.exists():
@@ -25,8 +29,26 @@ class SqliteBasedConverter(AbstractConverter, abc.ABC):
     def get_table_names(self) -> List[str]:
         with self.sqlite_engine.connect() as connection:
             result = connection.execute(sqlalchemy.text("""SELECT name FROM sqlite_master WHERE type = 'table';"""))
-            table_names = [r.name for r in result]
+            table_names = [
+                r.name for r in result if self.options.is_table_selected(r.name)
+            ]
         return table_names
 
     def get_table_dataframe(self, table_name: str) -> pd.DataFrame:
-        return pd.read_sql_table(table_name, self.sqlite_engine)
+        pd_table = pd.read_sql_table(table_name, self.sqlite_engine)
+        if self.options.manifests:
+            self.manifest.record_dataframe(table_name, pd_table)
+        return pd_table
+
+    def get_table_dataframe_chunks(
+        self, table_name: str, chunk_size: int = 50_000
+    ) -> Iterator[pd.DataFrame]:
+        with self.sqlite_engine.connect() as connection:
+            dataframes = pd.read_sql_query(
+                sqlalchemy.text(f"SELECT * FROM {table_name}"),
+                connection,
+                chunksize=chunk_size,
+            )
+            if self.options.manifests:
+                dataframes = self.manifest.track_dataframes(table_name, dataframes)
+            yield from dataframes
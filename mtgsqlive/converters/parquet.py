@@ -1,26 +1,42 @@
-from typing import Any, Dict
+import logging
+from typing import Any, Dict, Optional
 
 import pyarrow
 import pyarrow.parquet
 
 from ..enums import MtgjsonDataType
-from .parents import SqliteBasedConverter
+from .parents import ConverterOptions, SqliteBasedConverter
+
+LOGGER = logging.getLogger(__name__)
 
 
 class ParquetConverter(SqliteBasedConverter):
     def __init__(
-        self, mtgjson_data: Dict[str, Any], output_dir: str, data_type: MtgjsonDataType
+        self,
+        mtgjson_data: Dict[str, Any],
+        output_dir: str,
+        data_type: MtgjsonDataType,
+        options: Optional[ConverterOptions] = None,
     ) -> None:
-        super().__init__(mtgjson_data, output_dir, data_type)
+        super().__init__(mtgjson_data, output_dir, data_type, options)
         self.output_obj.root_dir.joinpath("parquet").mkdir(parents=True, exist_ok=True)
 
     def convert(self) -> None:
         for table_name in self.get_table_names():
+            if self.is_checkpoint_step_complete(table_name):
+                LOGGER.info(f"Skipping {table_name}, finished in a previous run")
+                continue
+
+            if self.is_partitioned_table(table_name):
+                self.__write_partitioned_table(table_name)
+                self.mark_checkpoint_step_complete(table_name)
+                continue
+
             pd_table = self.get_table_dataframe(table_name)
 
             parquet_table = pyarrow.Table.from_pandas(
                 pd_table, preserve_index=False
-            ).replace_schema_metadata(self.get_metadata())
+            ).replace_schema_metadata(self.get_parquet_metadata())
 
             pyarrow.parquet.write_table(
                 parquet_table,
@@ -30,3 +46,46 @@ class ParquetConverter(SqliteBasedConverter):
                     )
                 ),
             )
+            self.mark_checkpoint_step_complete(table_name)
+
+        # Pooled connections keep the database's -wal & -shm files around
+        self.sqlite_engine.dispose()
+
+    def __write_partitioned_table(self, table_name: str) -> None:
+        # Hive style layout, one directory per month, written chunk by chunk
+        table_dir = self.output_obj.root_dir.joinpath(
+            "parquet", self.data_type.value, table_name
+        )
+        partition_column = self.partitioned_tables[table_name]
+
+        parquet_writers: Dict[str, pyarrow.parquet.ParquetWriter] = {}
+        try:
+            for pd_chunk in self.get_table_dataframe_chunks(table_name):
+                partitions = pd_chunk[partition_column].astype(str).str[:7]
+                for partition, pd_partition in pd_chunk.groupby(partitions):
+                    parquet_table = pyarrow.Table.from_pandas(
+                        pd_partition, preserve_index=False
+                    ).replace_schema_metadata(self.get_parquet_metadata())
+
+                    if partition not in parquet_writers:
+                        partition_dir = table_dir.joinpath(f"month={partition}")
+                        partition_dir.mkdir(parents=True, exist_ok=True)
+                        parquet_writers[partition] = pyarrow.parquet.ParquetWriter(
+                            str(partition_dir.joinpath("part-0.parquet")),
+                            parquet_table.schema,
+                        )
+
+                    parquet_writer = parquet_writers[partition]
+                    parquet_writer.write_table(
+                        parquet_table.cast(parquet_writer.schema)
+                    )
+        finally:
+            for parquet_writer in parquet_writers.values():
+                parquet_writer.close()
+
+    def get_parquet_metadata(self) -> Dict[str, str]:
+        return {
+            str(key): str(value)
+            for metadata in self.get_metadata()
+            for key, value in metadata.items()
+        }
@@ -1,20 +1,29 @@
-from datetime import datetime
-from typing import Any, Dict, Iterator
+import json
+import re
+from datetime import date, datetime
+from typing import Any, Dict, Iterator, List, Optional
 
-import pymysql
+from ..enums import STREAMED_DATA_TYPES, MtgjsonDataType
+from .parents import ConverterOptions, Row, SqlLikeConverter
 
-from ..enums import MtgjsonDataType
-from .parents import SqlLikeConverter
+# NULL or a single quoted literal, which numbers & booleans are written as too
+POSTGRESQL_VALUE_PATTERN = re.compile(r"(NULL)|'([^']*(?:''[^']*)*)'")
 
 
 class PostgresqlConverter(SqlLikeConverter):
+    string_quote = "'"
+
     def __init__(
-        self, mtgjson_data: Dict[str, Any], output_dir: str, data_type: MtgjsonDataType
+        self,
+        mtgjson_data: Dict[str, Any],
+        output_dir: str,
+        data_type: MtgjsonDataType,
+        options: Optional[ConverterOptions] = None,
     ) -> None:
-        super().__init__(mtgjson_data, output_dir, data_type)
-        self.output_obj.fp = self.output_obj.root_dir.joinpath(
-            f"{data_type.value}.psql"
-        ).open("w", encoding="utf-8")
+        super().__init__(mtgjson_data, output_dir, data_type, options)
+        self.output_obj.fp = self.open_resumable_output_file(
+            self.output_obj.root_dir.joinpath(f"{data_type.value}.psql")
+        )
 
     def convert(self) -> None:
         sql_schema_as_dict = self._generate_sql_schema_dict()
@@ -39,40 +48,66 @@ class PostgresqlConverter(SqlLikeConverter):
                 "",
             )
         )
-        self.output_obj.fp.write(header)
+        if not self.is_checkpoint_step_complete("schema"):
+            self.output_obj.fp.write(header)
+            self.mark_checkpoint_step_complete(
+                "schema", offset=self.get_output_offset()
+            )
 
-        insert_data_generator = self.generate_database_insert_statements()
-        self.write_statements_to_file(insert_data_generator)
+        if (
+            self.data_type in STREAMED_DATA_TYPES
+            and not self.is_checkpoint_step_complete("partitions")
+        ):
+            self.write_partitioned_statements_to_files(
+                self.generate_partitioned_insert_statements(sql_schema_as_dict),
+                file_extension="psql",
+            )
+            self.mark_checkpoint_step_complete("partitions")
+
+        self.write_tables_to_file(
+            sql_schema_as_dict,
+            skip_partitioned_tables=self.data_type in STREAMED_DATA_TYPES,
+        )
 
-    def create_insert_statement_body(self, data: Dict[str, Any]) -> str:
+    def create_insert_statement_body(self, data: Row) -> str:
         pre_processed_values = []
-        for value in data.values():
-            if not value:
+        for value in data:
+            if value is None:
                 pre_processed_values.append("NULL")
-                continue
-
-            if isinstance(value, list):
-                statement = (
-                    pymysql.converters.escape_string(", ".join(map(str, value)))
-                    .replace("\\'", "''")
-                    .replace('\\"', '"')
+            elif isinstance(value, (int, float)):
+                # Numbers (and booleans) never contain characters that need escaping
+                pre_processed_values.append(f"'{value}'")
+            elif isinstance(value, str):
+                pre_processed_values.append(self.format_string_literal(value))
+            elif isinstance(value, list):
+                pre_processed_values.append(
+                    self.format_string_literal(", ".join(map(str, value)))
                 )
-                pre_processed_values.append(f"'{statement}'")
-            else:
-                statement = (
-                    pymysql.converters.escape_string(str(value))
-                    .replace("\\'", "''")
-                    .replace('\\"', '"')
+            elif isinstance(value, dict):
+                pre_processed_values.append(
+                    self.format_string_literal(json.dumps(value))
                 )
-                pre_processed_values.append(f"'{statement}'")
+            else:
+                pre_processed_values.append(self.format_string_literal(str(value)))
 
         return ", ".join(pre_processed_values)
 
+    @staticmethod
+    def escape_string_literal(value: str) -> str:
+        # Backslashes are ordinary characters with standard_conforming_strings
+        return "'" + value.replace("'", "''") + "'"
+
+    @staticmethod
+    def decode_insert_statement_body(body: str) -> List[Optional[str]]:
+        return [
+            None if null else value.replace("''", "'")
+            for null, value in POSTGRESQL_VALUE_PATTERN.findall(body)
+        ]
+
+    @staticmethod
+    def format_date_literal(value: date) -> str:
+        # Untyped literals in a SELECT list resolve to text, which won't insert into DATE
+        return f"DATE '{value}'"
+
     def write_statements_to_file(self, data_generator: Iterator[str]) -> None:
-        statements = []
-        for statement in data_generator:
-            statements.append(statement)
-            if len(statements) >= 1_000:
-                self.output_obj.fp.writelines(statements)
-                statements = []
-        self.output_obj.fp.writelines(statements)
+        self.write_statement_batches(data_generator, self.output_obj.fp.writelines)
@@ -1,82 +1,123 @@
 import json
+import re
 import sqlite3
 from collections import defaultdict
-from typing import Any, Dict, Iterator
-
-import pymysql
+from typing import Any, Dict, Iterator, List, Optional
 
 from ..enums import MtgjsonDataType
-from .parents import SqlLikeConverter
+from .parents import ConverterOptions, Row, SqlLikeConverter
 
 nested_dict: Any = lambda: defaultdict(nested_dict)
 
+# NULL, a boolean's 1 or 0, or a double quoted literal
+SQLITE_VALUE_PATTERN = re.compile(r'(NULL)|([01])|"([^"]*(?:""[^"]*)*)"')
+
 
 class SqliteConverter(SqlLikeConverter):
     def __init__(
-        self, mtgjson_data: Dict[str, Any], output_dir: str, data_type: MtgjsonDataType
+        self,
+        mtgjson_data: Dict[str, Any],
+        output_dir: str,
+        data_type: MtgjsonDataType,
+        options: Optional[ConverterOptions] = None,
     ) -> None:
-        super().__init__(mtgjson_data, output_dir, data_type)
-
-        self.output_obj.fp = sqlite3.connect(
-            self.output_obj.root_dir.joinpath(f"{data_type.value}.sqlite")
-        )
+        super().__init__(mtgjson_data, output_dir, data_type, options)
+
+        db_path = self.output_obj.root_dir.joinpath(f"{data_type.value}.sqlite")
+        self.discard_stale_checkpoint(db_path)
+        if not self.is_checkpoint_step_complete("schema"):
+            # Start over like the text outputs do, rather than clash with old tables
+            for stale_path in (
+                db_path,
+                db_path.with_name(f"{db_path.name}-wal"),
+                db_path.with_name(f"{db_path.name}-shm"),
+            ):
+                stale_path.unlink(missing_ok=True)
+        # Batches are executed from the background writer thread, one at a time
+        self.output_obj.fp = sqlite3.connect(db_path, check_same_thread=False)
         self.output_obj.fp.execute("pragma journal_mode=wal;")
 
     def convert(self) -> None:
         sql_schema_as_dict = self._generate_sql_schema_dict()
+        # Indexes are built after the bulk load, rather than updated per row
         schema_query = self._convert_schema_dict_to_query(
-            sql_schema_as_dict, engine="", primary_key_op=None
+            sql_schema_as_dict, engine="", primary_key_op=None, include_indexes=False
         )
 
-        self.output_obj.fp.executescript(schema_query)
+        if not self.is_checkpoint_step_complete("schema"):
+            self.output_obj.fp.executescript(schema_query)
+            self.mark_checkpoint_step_complete("schema")
+
+        self.write_tables_to_file(sql_schema_as_dict)
+
+        # Fold the WAL back into the database file, worker processes exit
+        # without ever closing the connection, leaving the rows in the -wal file
+        self.output_obj.fp.execute("pragma wal_checkpoint(TRUNCATE);")
+        self.output_obj.fp.close()
 
-        insert_data_generator = self.generate_database_insert_statements()
-        self.write_statements_to_file(insert_data_generator)
+    def get_output_offset(self) -> Optional[int]:
+        # Every batch is committed, so there is nothing to truncate on resume
+        return None
 
-    def create_insert_statement_body(self, data: Dict[str, Any]) -> str:
+    def clear_table(self, table_name: str) -> None:
+        self.output_obj.fp.execute(f"DELETE FROM {table_name}")
+        self.output_obj.fp.commit()
+
+    def create_deferred_indexes(self, schema: Dict[str, Any]) -> None:
+        if self.is_checkpoint_step_complete("indexes"):
+            return
+
+        index_queries = [
+            index_query
+            for table_name, table_data in schema.items()
+            for index_query in self._get_table_index_queries(table_name, table_data)
+        ]
+        # A single transaction, so an interrupted build never keeps half of them
+        self.output_obj.fp.executescript(
+            "\n".join(("BEGIN;", *index_queries, "COMMIT;"))
+        )
+        self.mark_checkpoint_step_complete("indexes")
+
+    def create_insert_statement_body(self, data: Row) -> str:
         pre_processed_values = []
-        for value in data.values():
+        for value in data:
             if value is None:
                 pre_processed_values.append("NULL")
-
+            elif isinstance(value, bool):
+                pre_processed_values.append("1" if value else "0")
+            elif isinstance(value, (int, float)):
+                # Numbers never contain characters that need escaping
+                pre_processed_values.append(f'"{value}"')
+            elif isinstance(value, str):
+                pre_processed_values.append(self.format_string_literal(value))
             elif isinstance(value, list):
-                statement = (
-                    pymysql.converters.escape_string(", ".join(map(str, value)))
-                    .replace("\\'", "'")
-                    .replace('\\"', '""')
+                pre_processed_values.append(
+                    self.format_string_literal(", ".join(map(str, value)))
                 )
-                pre_processed_values.append(f'"{statement}"')
-
             elif isinstance(value, dict):
-                statement = (
-                    pymysql.converters.escape_string(json.dumps(value))
-                    .replace("\\'", "'")
-                    .replace('\\"', '""')
+                pre_processed_values.append(
+                    self.format_string_literal(json.dumps(value))
                 )
-                pre_processed_values.append(f'"{statement}"')
-
-            elif isinstance(value, bool):
-                pre_processed_values.append("1" if value else "0")
-                
             else:
-                statement = (
-                    pymysql.converters.escape_string(str(value))
-                    .replace("\\'", "'")
-                    .replace('\\"', '""')
-                )
-                pre_processed_values.append(f'"{statement}"')
+                pre_processed_values.append(self.format_string_literal(str(value)))
 
         return ", ".join(pre_processed_values)
 
+    @staticmethod
+    def escape_string_literal(value: str) -> str:
+        # Backslashes are ordinary characters in SQLite string literals
+        return '"' + value.replace('"', '""') + '"'
+
+    @staticmethod
+    def decode_insert_statement_body(body: str) -> List[Optional[str]]:
+        return [
+            None if null else boolean or value.replace('""', '"')
+            for null, boolean, value in SQLITE_VALUE_PATTERN.findall(body)
+        ]
+
     def write_statements_to_file(self, data_generator: Iterator[str]) -> None:
-        cursor = self.output_obj.fp.cursor()
-        statements = []
-
-        for statement in data_generator:
-            statements.append(statement)
-            if len(statements) >= 1_000:
-                cursor.executescript("\n".join(statements))
-                self.output_obj.fp.commit()
-                statements = []
-        cursor.executescript("\n".join(statements))
+        self.write_statement_batches(data_generator, self.__execute_statements)
+
+    def __execute_statements(self, statements: List[str]) -> None:
+        self.output_obj.fp.executescript("\n".join(statements))
         self.output_obj.fp.commit()
@@ -1 +1 @@
-from .data_type import MtgjsonDataType
+from .data_type import STREAMED_DATA_TYPES, MtgjsonDataType
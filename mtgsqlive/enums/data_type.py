@@ -4,3 +4,9 @@ import enum
 class MtgjsonDataType(enum.Enum):
     MTGJSON_CARDS = "AllPrintings"
     MTGJSON_CARD_PRICES = "AllPricesToday"
+    MTGJSON_ALL_PRICES = "AllPrices"
+
+
+# Data types too large to load at once. Their input is streamed and their
+# large tables are written in monthly partitions
+STREAMED_DATA_TYPES = {MtgjsonDataType.MTGJSON_ALL_PRICES}
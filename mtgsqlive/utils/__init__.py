@@ -0,0 +1,8 @@
+from .background_writer import BackgroundWriter, WriterStats
+from .checkpoint import BuildCheckpoint
+from .index_plan import DEFAULT_INDEX_PLAN, IndexPlan, load_index_plan
+from .json_backend import JSON_BACKENDS, load_json_file, resolve_json_backend
+from .json_stream import StreamedJsonObject, load_streamed_mtgjson_file
+from .manifest import BuildManifest, verify_manifests
+from .schema_cache import SchemaCache, get_file_sha256, load_schema_file
+from .shard_groups import get_shard_dir_name, load_shard_groups
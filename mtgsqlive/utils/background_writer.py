@@ -0,0 +1,94 @@
+import dataclasses
+import queue
+import threading
+import time
+from typing import Any, Callable, Generic, Optional, TypeVar
+
+T = TypeVar("T")
+
+# Tells the writer thread that no more batches are coming
+_END_OF_BATCHES = object()
+
+
+@dataclasses.dataclass
+class WriterStats:
+    batches: int = 0
+    # Times the producer found the queue full, and how long it waited for space
+    producer_stalls: int = 0
+    producer_stall_seconds: float = 0.0
+    # How long the writer sat waiting on an empty queue
+    writer_idle_seconds: float = 0.0
+    write_seconds: float = 0.0
+
+    def __str__(self) -> str:
+        return (
+            f"{self.batches} batches written in {self.write_seconds:.2f}s, "
+            f"producer stalled {self.producer_stalls} times "
+            f"({self.producer_stall_seconds:.2f}s), "
+            f"writer idle {self.writer_idle_seconds:.2f}s"
+        )
+
+
+# Hands batches to a separate thread through a bounded queue, so building the
+# next batch overlaps with writing the previous one. Use as a context manager;
+# errors raised while writing are re-raised to the producer
+class BackgroundWriter(Generic[T]):
+    write_batch: Callable[[T], Any]
+    batch_queue: "queue.Queue[Any]"
+    stats: WriterStats
+    writer_error: Optional[BaseException]
+
+    def __init__(
+        self,
+        write_batch: Callable[[T], Any],
+        queue_depth: int,
+        stats: Optional[WriterStats] = None,
+    ) -> None:
+        self.write_batch = write_batch
+        self.batch_queue = queue.Queue(maxsize=queue_depth)
+        self.stats = stats or WriterStats()
+        self.writer_error = None
+        self.writer_thread = threading.Thread(target=self.__run, daemon=True)
+
+    def __enter__(self) -> "BackgroundWriter[T]":
+        self.writer_thread.start()
+        return self
+
+    def __exit__(self, *exc_info: Any) -> None:
+        self.batch_queue.put(_END_OF_BATCHES)
+        self.writer_thread.join()
+        if self.writer_error is not None and exc_info[0] is None:
+            raise self.writer_error
+
+    def submit(self, batch: T) -> None:
+        if self.writer_error is not None:
+            raise self.writer_error
+
+        if self.batch_queue.full():
+            self.stats.producer_stalls += 1
+            stall_start = time.perf_counter()
+            self.batch_queue.put(batch)
+            self.stats.producer_stall_seconds += time.perf_counter() - stall_start
+        else:
+            self.batch_queue.put(batch)
+
+    def __run(self) -> None:
+        while True:
+            idle_start = time.perf_counter()
+            batch = self.batch_queue.get()
+            self.stats.writer_idle_seconds += time.perf_counter() - idle_start
+            if batch is _END_OF_BATCHES:
+                return
+
+            # After a failure keep draining, so the producer never blocks forever
+            if self.writer_error is not None:
+                continue
+
+            write_start = time.perf_counter()
+            try:
+                self.write_batch(batch)
+            except BaseException as error:
+                self.writer_error = error
+                continue
+            self.stats.write_seconds += time.perf_counter() - write_start
+            self.stats.batches += 1
@@ -0,0 +1,103 @@
+import json
+import logging
+import pathlib
+from typing import Any, Dict, Optional
+
+from .schema_cache import normalize_cache_key
+
+LOGGER = logging.getLogger(__name__)
+
+
+# Records the finished converters of one data type, and the finished steps
+# (schema, tables, ...) within each converter, so an interrupted build can be
+# resumed. Every change is saved to disk straight away
+class BuildCheckpoint:
+    checkpoint_path: pathlib.Path
+    identity: Dict[str, Any]
+    converters: Dict[str, Dict[str, Any]]
+
+    def __init__(self, checkpoint_path: pathlib.Path, identity: Dict[str, Any]) -> None:
+        self.checkpoint_path = checkpoint_path
+        self.identity = normalize_cache_key(identity)
+        self.converters = {}
+
+    @classmethod
+    def load(
+        cls, checkpoint_path: pathlib.Path, identity: Dict[str, Any]
+    ) -> "BuildCheckpoint":
+        checkpoint = cls(checkpoint_path, identity)
+        if not checkpoint_path.is_file():
+            return checkpoint
+
+        with checkpoint_path.open(encoding="utf-8") as fp:
+            checkpoint_contents = json.load(fp)
+
+        # A different input file or different options invalidate all progress
+        if checkpoint_contents.get("identity") != checkpoint.identity:
+            LOGGER.warning(f"Ignoring checkpoint {checkpoint_path}, build changed")
+            return checkpoint
+
+        checkpoint.converters = checkpoint_contents["converters"]
+        return checkpoint
+
+    def is_converter_complete(self, converter_name: str) -> bool:
+        return bool(self.__get_converter_state(converter_name)["complete"])
+
+    def mark_converter_complete(self, converter_name: str) -> None:
+        self.__get_or_create_converter_state(converter_name)["complete"] = True
+        self.save()
+
+    def reset_converter(self, converter_name: str) -> None:
+        if self.converters.pop(converter_name, None) is not None:
+            self.save()
+
+    def get_step(self, converter_name: str, step_name: str) -> Optional[Dict[str, Any]]:
+        step: Optional[Dict[str, Any]] = self.__get_converter_state(converter_name)[
+            "steps"
+        ].get(step_name)
+        return step
+
+    def get_steps(self, converter_name: str) -> Dict[str, Dict[str, Any]]:
+        steps: Dict[str, Dict[str, Any]] = self.__get_converter_state(converter_name)[
+            "steps"
+        ]
+        return steps
+
+    def get_resume_offset(self, converter_name: str) -> Optional[int]:
+        # Output offsets only grow, so the largest belongs to the last finished step
+        offsets = [
+            step["offset"]
+            for step in self.__get_converter_state(converter_name)["steps"].values()
+            if step.get("offset") is not None
+        ]
+        return max(offsets, default=None)
+
+    def mark_step_complete(
+        self, converter_name: str, step_name: str, **step_details: Any
+    ) -> None:
+        self.__get_or_create_converter_state(converter_name)["steps"][
+            step_name
+        ] = step_details
+        self.save()
+
+    def save(self) -> None:
+        # Written to a temporary file first, so a crash never leaves it half written
+        tmp_checkpoint_path = self.checkpoint_path.with_suffix(".tmp")
+        with tmp_checkpoint_path.open("w", encoding="utf-8") as fp:
+            json.dump(
+                {"identity": self.identity, "converters": self.converters},
+                fp,
+                indent=4,
+            )
+        tmp_checkpoint_path.replace(self.checkpoint_path)
+
+    def delete(self) -> None:
+        self.checkpoint_path.unlink(missing_ok=True)
+
+    def __get_converter_state(self, converter_name: str) -> Dict[str, Any]:
+        return self.converters.get(converter_name, {"complete": False, "steps": {}})
+
+    def __get_or_create_converter_state(self, converter_name: str) -> Dict[str, Any]:
+        return self.converters.setdefault(
+            converter_name, {"complete": False, "steps": {}}
+        )
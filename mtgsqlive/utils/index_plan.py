@@ -0,0 +1,54 @@
+import json
+import pathlib
+from typing import Any, Dict, List
+
+# Table name to the column lists to index, on top of the uuid indexes
+IndexPlan = Dict[str, List[List[str]]]
+
+DEFAULT_INDEX_PLAN: IndexPlan = {
+    "cards": [["setCode"], ["name"]],
+    "cardForeignData": [["language"]],
+    "cardLegalities": [
+        ["standard"],
+        ["pioneer"],
+        ["modern"],
+        ["legacy"],
+        ["vintage"],
+        ["commander"],
+        ["pauper"],
+    ],
+    "setBoosterSheetCards": [["cardUuid"]],
+    "cardPrices": [["date"]],
+}
+
+
+def load_index_plan(index_plan_path: pathlib.Path) -> IndexPlan:
+    # Tables named in the file replace their default indexes, an empty list
+    # drops them. A bare column name is shorthand for a single column index
+    with index_plan_path.expanduser().open(encoding="utf-8") as fp:
+        index_plan_contents: Any = json.load(fp)
+
+    if not isinstance(index_plan_contents, dict):
+        raise ValueError(f"{index_plan_path} must map table names to index lists")
+
+    index_plan = {
+        table_name: [list(index_columns) for index_columns in table_indexes]
+        for table_name, table_indexes in DEFAULT_INDEX_PLAN.items()
+    }
+    for table_name, table_indexes in index_plan_contents.items():
+        if not isinstance(table_indexes, list):
+            raise ValueError(f"{index_plan_path}: {table_name} must list its indexes")
+
+        index_plan[table_name] = []
+        for index_columns in table_indexes:
+            if isinstance(index_columns, str):
+                index_columns = [index_columns]
+            if not index_columns or not all(
+                isinstance(column, str) for column in index_columns
+            ):
+                raise ValueError(
+                    f"{index_plan_path}: {table_name} has an invalid index {index_columns!r}"
+                )
+            index_plan[table_name].append(index_columns)
+
+    return index_plan
@@ -0,0 +1,49 @@
+import importlib
+import json
+import mmap
+import pathlib
+from typing import Any, Callable, Dict, List
+
+# Decoders tried by "auto", fastest first. Both are optional dependencies
+OPTIONAL_JSON_BACKENDS: List[str] = ["orjson", "ujson"]
+JSON_BACKENDS: List[str] = ["auto", *OPTIONAL_JSON_BACKENDS, "stdlib"]
+
+# Each decoder takes the mapped file's buffer
+JSON_DECODERS: Dict[str, Callable[[Any], Any]] = {
+    "orjson": lambda data: importlib.import_module("orjson").loads(data),
+    "ujson": lambda data: importlib.import_module("ujson").loads(bytes(data)),
+    "stdlib": lambda data: json.loads(str(data, "utf-8")),
+}
+
+
+def resolve_json_backend(backend_name: str = "auto") -> str:
+    if backend_name == "stdlib":
+        return backend_name
+
+    if backend_name != "auto":
+        # An explicitly requested backend must be installed
+        importlib.import_module(backend_name)
+        return backend_name
+
+    for optional_backend in OPTIONAL_JSON_BACKENDS:
+        try:
+            importlib.import_module(optional_backend)
+        except ImportError:
+            continue
+        return optional_backend
+    return "stdlib"
+
+
+def load_json_file(file_path: pathlib.Path, backend_name: str = "auto") -> Any:
+    # The file is memory-mapped, so orjson decodes straight from the page
+    # cache. The other decoders need one copy of it, like json.load always did
+    backend_name = resolve_json_backend(backend_name)
+    decode = JSON_DECODERS[backend_name]
+
+    with file_path.open("rb") as fp:
+        if not file_path.stat().st_size:
+            return decode(b"")
+
+        with mmap.mmap(fp.fileno(), 0, access=mmap.ACCESS_READ) as mapped_file:
+            with memoryview(mapped_file) as mapped_view:
+                return decode(mapped_view)
@@ -0,0 +1,185 @@
+import json
+import pathlib
+from typing import Any, Dict, Iterator, NoReturn, TextIO, Tuple
+
+JSON_WHITESPACE = " \t\n\r"
+# Values decoded, or failing to, this close to the buffer's end may have been
+# cut short, e.g. "tru" or "1.5e", so they're retried with another chunk read in
+TRUNCATION_MARGIN = 16
+
+
+# Incrementally decodes a JSON document whose top level is an object, so only
+# a single member value has to be held in memory at a time
+class JsonObjectStreamer:
+    fp: TextIO
+    chunk_size: int
+    buffer: str
+    position: int
+    # Bytes of input dropped from the front of the buffer so far
+    buffer_offset: int
+    is_eof: bool
+
+    def __init__(self, fp: TextIO, chunk_size: int = 1024 * 1024) -> None:
+        self.fp = fp
+        self.chunk_size = chunk_size
+        self.buffer = ""
+        self.position = 0
+        self.buffer_offset = 0
+        self.is_eof = False
+        self.decoder = json.JSONDecoder()
+
+    def iter_top_level_keys(self) -> Iterator[str]:
+        # Yields each top level key with the stream positioned at its value,
+        # which the caller must consume via decode_value() or iter_object_items()
+        self.__expect("{")
+        if self.__peek() == "}":
+            self.position += 1
+            return
+
+        while True:
+            key = self.decode_value()
+            self.__expect(":")
+            yield key
+            if self.__next_separator() == "}":
+                return
+
+    def iter_object_items(self) -> Iterator[Tuple[str, Any]]:
+        self.__expect("{")
+        if self.__peek() == "}":
+            self.position += 1
+            return
+
+        while True:
+            key = self.decode_value()
+            self.__expect(":")
+            yield key, self.decode_value()
+            if self.__next_separator() == "}":
+                return
+
+    def decode_value(self) -> Any:
+        self.__skip_whitespace()
+        while True:
+            try:
+                value, end = self.decoder.raw_decode(self.buffer, self.position)
+            except json.JSONDecodeError as error:
+                if not self.__is_truncated(error) or not self.__read_chunk():
+                    self.__raise_decode_error(error.msg, error.pos)
+                continue
+
+            # A number ending near the buffer edge may be truncated, e.g. "1.5"
+            # read as 1 followed by junk
+            if end > len(self.buffer) - TRUNCATION_MARGIN and self.__read_chunk():
+                continue
+
+            self.position = end
+            return value
+
+    def __next_separator(self) -> str:
+        separator = self.__peek()
+        if separator not in ",}":
+            self.__raise_decode_error("Expecting ',' or '}'", self.position)
+        self.position += 1
+        return separator
+
+    def __expect(self, expected: str) -> None:
+        if self.__peek() != expected:
+            self.__raise_decode_error(f"Expecting '{expected}'", self.position)
+        self.position += 1
+
+    def __peek(self) -> str:
+        self.__skip_whitespace()
+        if self.position >= len(self.buffer):
+            self.__raise_decode_error("Unexpected end of data", self.position)
+        return self.buffer[self.position]
+
+    def __is_truncated(self, error: json.JSONDecodeError) -> bool:
+        # Any other error is already in the buffer, so reading on won't fix it
+        if error.msg.startswith("Unterminated string"):
+            return True
+        return error.pos >= len(self.buffer) - TRUNCATION_MARGIN
+
+    def __raise_decode_error(self, message: str, position: int) -> NoReturn:
+        byte_offset = self.buffer_offset + len(
+            self.buffer[:position].encode("utf-8", "surrogatepass")
+        )
+        raise ValueError(
+            f"Malformed JSON at byte offset {byte_offset}: {message}"
+        ) from None
+
+    def __skip_whitespace(self) -> None:
+        while True:
+            while (
+                self.position < len(self.buffer)
+                and self.buffer[self.position] in JSON_WHITESPACE
+            ):
+                self.position += 1
+            if self.position < len(self.buffer) or not self.__read_chunk():
+                return
+
+    def __read_chunk(self) -> bool:
+        if self.is_eof:
+            return False
+
+        chunk = self.fp.read(self.chunk_size)
+        if not chunk:
+            self.is_eof = True
+            return False
+
+        # Drop everything already consumed before growing the buffer
+        self.buffer_offset += len(
+            self.buffer[: self.position].encode("utf-8", "surrogatepass")
+        )
+        self.buffer = self.buffer[self.position :] + chunk
+        self.position = 0
+        return True
+
+
+# Read-only mapping over one top level member of a JSON file. Every iteration
+# re-reads the file, so memory stays bounded by a single entry
+class StreamedJsonObject:
+    file_path: pathlib.Path
+    member_name: str
+
+    def __init__(self, file_path: pathlib.Path, member_name: str) -> None:
+        self.file_path = file_path
+        self.member_name = member_name
+
+    def items(self) -> Iterator[Tuple[str, Any]]:
+        with self.file_path.open(encoding="utf-8", newline="") as fp:
+            streamer = JsonObjectStreamer(fp)
+            for key in streamer.iter_top_level_keys():
+                if key == self.member_name:
+                    yield from streamer.iter_object_items()
+                    return
+                streamer.decode_value()
+
+    def keys(self) -> Iterator[str]:
+        for key, _ in self.items():
+            yield key
+
+    def values(self) -> Iterator[Any]:
+        for _, value in self.items():
+            yield value
+
+    def __iter__(self) -> Iterator[str]:
+        return self.keys()
+
+
+def load_streamed_mtgjson_file(file_path: pathlib.Path) -> Dict[str, Any]:
+    # Only "meta" is decoded up front; "data" is streamed on demand
+    meta: Dict[str, Any] = {}
+    with file_path.open(encoding="utf-8", newline="") as fp:
+        streamer = JsonObjectStreamer(fp)
+        for key in streamer.iter_top_level_keys():
+            if key == "meta":
+                meta = streamer.decode_value()
+                break
+
+            # Members ahead of "meta" still have to be consumed
+            if key == "data":
+                for _ in streamer.iter_object_items():
+                    pass
+            else:
+                streamer.decode_value()
+
+    return {"meta": meta, "data": StreamedJsonObject(file_path, "data")}
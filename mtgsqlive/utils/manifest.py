@@ -0,0 +1,280 @@
+import dataclasses
+import datetime
+import hashlib
+import itertools
+import json
+import numbers
+import operator
+import pathlib
+from collections import defaultdict
+from typing import (
+    Any,
+    Callable,
+    Dict,
+    Iterator,
+    List,
+    Optional,
+    Sequence,
+    Tuple,
+    TypeVar,
+)
+
+# Row checksums are summed modulo 2**64, so they don't depend on row order
+CHECKSUM_MODULUS = 2**64
+# Stands in for NULL, which no text value can be
+NULL_VALUE = "\0"
+VALUE_SEPARATOR = "\x1f"
+
+T = TypeVar("T")
+
+
+def canonicalize_value(value: Any) -> str:
+    # Every output format must reduce a value to the same text, whether it
+    # comes from the input JSON or is read back from SQLite through pandas
+    if type(value) is str:
+        return value
+    if value is None:
+        return NULL_VALUE
+    if isinstance(value, bool):
+        return "1" if value else "0"
+    if type(value) is int:
+        return str(value)
+    if isinstance(value, float):
+        # pandas reads NULL as NaN, & integer columns with NULLs as floats
+        if value != value:
+            return NULL_VALUE
+        if value.is_integer():
+            return str(int(value))
+        return repr(value)
+    if isinstance(value, numbers.Integral):
+        return str(int(value))
+    if isinstance(value, datetime.datetime):
+        if value != value:
+            return NULL_VALUE
+        if value.time() == datetime.time.min:
+            return value.date().isoformat()
+        return value.isoformat(sep=" ")
+    if isinstance(value, datetime.date):
+        return value.isoformat()
+    if isinstance(value, list):
+        return ", ".join(map(str, value))
+    if isinstance(value, dict):
+        return json.dumps(value)
+    return str(value)
+
+
+@dataclasses.dataclass
+class TableManifest:
+    # Sorted, so the checksum doesn't depend on a format's column order either
+    columns: List[str]
+    row_count: int = 0
+    checksum: int = 0
+
+    def to_json(self) -> Dict[str, Any]:
+        return {
+            "columns": self.columns,
+            "rowCount": self.row_count,
+            "checksum": f"{self.checksum:016x}",
+        }
+
+    @classmethod
+    def from_json(cls, table_entry: Dict[str, Any]) -> "TableManifest":
+        return cls(
+            columns=table_entry["columns"],
+            row_count=table_entry["rowCount"],
+            checksum=int(table_entry["checksum"], 16),
+        )
+
+
+class TableManifestBuilder:
+    columns: List[str]
+    column_getter: Callable[[Sequence[Any]], Sequence[Any]]
+    row_count: int
+    checksum_sum: int
+
+    def __init__(self, columns: Sequence[str]) -> None:
+        column_order = sorted(range(len(columns)), key=lambda i: columns[i])
+        self.columns = [columns[i] for i in column_order]
+        # itemgetter() only returns a tuple when given several columns
+        if len(column_order) == 1:
+            self.column_getter = lambda row: (row[column_order[0]],)
+        else:
+            self.column_getter = operator.itemgetter(*column_order)
+        self.row_count = 0
+        self.checksum_sum = 0
+
+    def add_row(self, row: Sequence[Any]) -> None:
+        # Most values are text, so they skip canonicalize_value() altogether
+        row_text = VALUE_SEPARATOR.join(
+            [
+                value if type(value) is str else canonicalize_value(value)
+                for value in self.column_getter(row)
+            ]
+        )
+        row_hash = hashlib.blake2b(row_text.encode("utf-8"), digest_size=8).digest()
+        self.row_count += 1
+        # Reduced once at the end, rather than per row
+        self.checksum_sum += int.from_bytes(row_hash, "big")
+
+    def get_table_manifest(self) -> TableManifest:
+        return TableManifest(
+            columns=self.columns,
+            row_count=self.row_count,
+            checksum=self.checksum_sum % CHECKSUM_MODULUS,
+        )
+
+
+# Per table row counts & order independent checksums of one converter's output.
+# A table is only recorded once all of its rows went by
+class BuildManifest:
+    tables: Dict[str, TableManifest]
+
+    def __init__(self) -> None:
+        self.tables = {}
+
+    def track_rows(
+        self,
+        table_name: str,
+        columns: Sequence[str],
+        rows: Iterator[T],
+        read_row: Callable[[T], Sequence[Any]],
+    ) -> Iterator[T]:
+        # Rows are passed through as written, read_row() gives back their values
+        manifest_builder = TableManifestBuilder(columns)
+        for row in rows:
+            manifest_builder.add_row(read_row(row))
+            yield row
+        self.tables[table_name] = manifest_builder.get_table_manifest()
+
+    def track_dataframes(
+        self, table_name: str, dataframes: Iterator[Any]
+    ) -> Iterator[Any]:
+        manifest_builder: Optional[TableManifestBuilder] = None
+        for dataframe in dataframes:
+            if manifest_builder is None:
+                manifest_builder = TableManifestBuilder(list(dataframe.columns))
+            for row in dataframe.itertuples(index=False, name=None):
+                manifest_builder.add_row(row)
+            yield dataframe
+
+        if manifest_builder is not None:
+            self.tables[table_name] = manifest_builder.get_table_manifest()
+
+    def record_dataframe(self, table_name: str, dataframe: Any) -> None:
+        for _ in self.track_dataframes(table_name, iter([dataframe])):
+            pass
+
+    def restore_table_entries(self, table_entries: Dict[str, Dict[str, Any]]) -> None:
+        # Fills in tables a previous, interrupted run already went through
+        for table_name, table_entry in table_entries.items():
+            self.tables.setdefault(table_name, TableManifest.from_json(table_entry))
+
+    def get_table_entries(self) -> Dict[str, Dict[str, Any]]:
+        return {
+            table_name: table_manifest.to_json()
+            for table_name, table_manifest in self.tables.items()
+        }
+
+    def save(self, manifest_path: pathlib.Path, **manifest_details: Any) -> None:
+        manifest_path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_manifest_path = manifest_path.with_suffix(".tmp")
+        with tmp_manifest_path.open("w", encoding="utf-8") as fp:
+            json.dump(
+                {**manifest_details, "tables": self.get_table_entries()},
+                fp,
+                indent=4,
+                sort_keys=True,
+            )
+        tmp_manifest_path.replace(manifest_path)
+
+
+def load_manifest(manifest_path: pathlib.Path) -> Dict[str, TableManifest]:
+    with manifest_path.open(encoding="utf-8") as fp:
+        manifest_contents = json.load(fp)
+
+    return {
+        table_name: TableManifest.from_json(table_entry)
+        for table_name, table_entry in manifest_contents["tables"].items()
+    }
+
+
+def compare_manifests(
+    expected_name: str,
+    expected_tables: Dict[str, TableManifest],
+    actual_name: str,
+    actual_tables: Dict[str, TableManifest],
+) -> List[str]:
+    # Only tables both outputs stream are comparable, e.g. SQL dumps never
+    # see the rows of tables they fill with INSERT ... SELECT
+    mismatches = []
+    for table_name in sorted(expected_tables.keys() & actual_tables.keys()):
+        expected_table = expected_tables[table_name]
+        actual_table = actual_tables[table_name]
+        if expected_table.columns != actual_table.columns:
+            mismatches.append(
+                f"{table_name}: columns differ between {expected_name} & {actual_name}"
+            )
+        elif expected_table.row_count != actual_table.row_count:
+            mismatches.append(
+                f"{table_name}: {expected_table.row_count} rows in {expected_name}, "
+                f"{actual_table.row_count} in {actual_name}"
+            )
+        elif expected_table.checksum != actual_table.checksum:
+            mismatches.append(
+                f"{table_name}: checksums differ between {expected_name} & {actual_name}"
+            )
+    return mismatches
+
+
+def verify_manifests(
+    manifest_dir: pathlib.Path, previous_manifest_dir: Optional[pathlib.Path] = None
+) -> Tuple[int, List[str]]:
+    # Manifests are named {data type}.{converter}.json. Every format of a data
+    # type is checked against the others, & each file against the same file
+    # of a previous build. Returns the manifests checked & the mismatches
+    manifest_paths = sorted(manifest_dir.glob("*.json"))
+    manifests_by_data_type: Dict[str, List[pathlib.Path]] = defaultdict(list)
+    for manifest_path in manifest_paths:
+        manifests_by_data_type[manifest_path.stem.split(".")[0]].append(manifest_path)
+
+    mismatches = []
+    for data_type_manifest_paths in manifests_by_data_type.values():
+        for expected_path, actual_path in itertools.combinations(
+            data_type_manifest_paths, 2
+        ):
+            mismatches.extend(
+                compare_manifests(
+                    expected_path.stem,
+                    load_manifest(expected_path),
+                    actual_path.stem,
+                    load_manifest(actual_path),
+                )
+            )
+
+    if previous_manifest_dir is not None:
+        for manifest_path in manifest_paths:
+            previous_manifest_path = previous_manifest_dir.joinpath(manifest_path.name)
+            if not previous_manifest_path.is_file():
+                mismatches.append(f"{manifest_path.stem}: no previous manifest")
+                continue
+
+            previous_tables = load_manifest(previous_manifest_path)
+            tables = load_manifest(manifest_path)
+            mismatches.extend(
+                f"{manifest_path.stem}: {table_name} missing from this build"
+                for table_name in sorted(previous_tables.keys() - tables.keys())
+            )
+            mismatches.extend(
+                f"{manifest_path.stem}: {table_name} is new in this build"
+                for table_name in sorted(tables.keys() - previous_tables.keys())
+            )
+            mismatches.extend(
+                compare_manifests(
+                    f"previous {manifest_path.stem}",
+                    previous_tables,
+                    manifest_path.stem,
+                    tables,
+                )
+            )
+
+    return len(manifest_paths), mismatches
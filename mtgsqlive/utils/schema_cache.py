@@ -0,0 +1,80 @@
+import hashlib
+import json
+import logging
+import pathlib
+from typing import Any, Dict, Optional
+
+LOGGER = logging.getLogger(__name__)
+
+
+class SchemaCache:
+    cache_dir: pathlib.Path
+
+    def __init__(self, cache_dir: pathlib.Path) -> None:
+        self.cache_dir = cache_dir.expanduser()
+        self.cache_dir.mkdir(parents=True, exist_ok=True)
+
+    def load(self, cache_key: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+        cache_path = self.get_cache_path(cache_key)
+        if not cache_path.is_file():
+            return None
+
+        with cache_path.open(encoding="utf-8") as fp:
+            cache_entry = json.load(fp)
+
+        if cache_entry.get("key") != normalize_cache_key(cache_key):
+            LOGGER.warning(f"Ignoring schema cache {cache_path}, key mismatch")
+            return None
+
+        schema: Dict[str, Any] = cache_entry["schema"]
+        return schema
+
+    def save(self, cache_key: Dict[str, Any], schema: Dict[str, Any]) -> None:
+        cache_path = self.get_cache_path(cache_key)
+        tmp_cache_path = cache_path.with_suffix(".tmp")
+        with tmp_cache_path.open("w", encoding="utf-8") as fp:
+            json.dump(
+                {"key": normalize_cache_key(cache_key), "schema": schema},
+                fp,
+                indent=4,
+            )
+        tmp_cache_path.replace(cache_path)
+
+    def get_cache_path(self, cache_key: Dict[str, Any]) -> pathlib.Path:
+        key_hash = hashlib.sha256(
+            json.dumps(normalize_cache_key(cache_key), sort_keys=True).encode("utf-8")
+        ).hexdigest()
+        return self.cache_dir.joinpath(
+            f"{cache_key['dataType']}_{cache_key['version']}_{key_hash[:16]}.json"
+        )
+
+
+def normalize_cache_key(cache_key: Dict[str, Any]) -> Dict[str, Any]:
+    # Round-trip through JSON so keys compare equal to ones read back from disk
+    normalized_key: Dict[str, Any] = json.loads(
+        json.dumps(
+            cache_key,
+            sort_keys=True,
+            default=lambda obj: sorted(obj) if isinstance(obj, set) else str(obj),
+        )
+    )
+    return normalized_key
+
+
+def load_schema_file(schema_path: pathlib.Path) -> Dict[str, Any]:
+    with schema_path.expanduser().open(encoding="utf-8") as fp:
+        schema_file_contents: Dict[str, Any] = json.load(fp)
+
+    # Cache entries can be pinned directly
+    if "key" in schema_file_contents and "schema" in schema_file_contents:
+        schema: Dict[str, Any] = schema_file_contents["schema"]
+        return schema
+    return schema_file_contents
+
+
+def get_file_sha256(file_path: pathlib.Path) -> str:
+    file_hash = hashlib.sha256()
+    with file_path.open("rb") as fp:
+        for chunk in iter(lambda: fp.read(1024 * 1024), b""):
+            file_hash.update(chunk)
+    return file_hash.hexdigest()
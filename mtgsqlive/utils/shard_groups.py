@@ -0,0 +1,58 @@
+import json
+import pathlib
+import re
+from typing import Any, Dict, List
+
+# Shard names become directory names
+SHARD_NAME_PATTERN = re.compile(r"[A-Za-z0-9][A-Za-z0-9_.-]*")
+UNSAFE_DIR_NAME_CHARACTERS = re.compile(r"[^A-Za-z0-9_.-]")
+# Device names Windows won't create a directory as, with or without extension
+WINDOWS_RESERVED_NAMES = frozenset(
+    ["CON", "PRN", "AUX", "NUL"]
+    + [f"COM{i}" for i in range(1, 10)]
+    + [f"LPT{i}" for i in range(1, 10)]
+)
+
+
+def get_shard_dir_name(shard_name: str) -> str:
+    # Set codes like CON are used as shard names as is, so they're suffixed
+    # to stay usable as directory names everywhere
+    shard_dir_name = UNSAFE_DIR_NAME_CHARACTERS.sub("_", shard_name)
+    if shard_dir_name.split(".")[
+        0
+    ].upper() in WINDOWS_RESERVED_NAMES or shard_dir_name.endswith("."):
+        shard_dir_name += "_"
+    return shard_dir_name
+
+
+def load_shard_groups(shard_groups_path: pathlib.Path) -> Dict[str, List[str]]:
+    # Maps each shard name to the set codes it holds
+    with shard_groups_path.expanduser().open(encoding="utf-8") as fp:
+        shard_groups_contents: Any = json.load(fp)
+
+    if not isinstance(shard_groups_contents, dict):
+        raise ValueError(f"{shard_groups_path} must map shard names to set codes")
+
+    shard_groups = {}
+    shard_dir_names: Dict[str, str] = {}
+    for shard_name, set_codes in shard_groups_contents.items():
+        if not SHARD_NAME_PATTERN.fullmatch(shard_name):
+            raise ValueError(f"{shard_groups_path}: invalid shard name {shard_name!r}")
+        shard_dir_name = get_shard_dir_name(shard_name).lower()
+        if shard_dir_name in shard_dir_names:
+            raise ValueError(
+                f"{shard_groups_path}: shards {shard_dir_names[shard_dir_name]} & "
+                f"{shard_name} would share a directory"
+            )
+        shard_dir_names[shard_dir_name] = shard_name
+        if (
+            not isinstance(set_codes, list)
+            or not set_codes
+            or not all(isinstance(set_code, str) for set_code in set_codes)
+        ):
+            raise ValueError(
+                f"{shard_groups_path}: {shard_name} must list at least one set code"
+            )
+        shard_groups[shard_name] = [set_code.upper() for set_code in set_codes]
+
+    return shard_groups